@@ -1,9 +1,10 @@
 """Open To Close API Python Client."""
 
-# Import service clients
-from .agents import AgentsAPI
-from .client import OpenToCloseAPI
-from .contacts import ContactsAPI
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+from dotenv import load_dotenv
+
 from .exceptions import (
     AuthenticationError,
     ConfigurationError,
@@ -16,15 +17,41 @@ from .exceptions import (
     TimeoutError,
     ValidationError,
 )
-from .properties import PropertiesAPI
-from .property_contacts import PropertyContactsAPI
-from .property_documents import PropertyDocumentsAPI
-from .property_emails import PropertyEmailsAPI
-from .property_notes import PropertyNotesAPI
-from .property_tasks import PropertyTasksAPI
-from .tags import TagsAPI
-from .teams import TeamsAPI
-from .users import UsersAPI
+
+if TYPE_CHECKING:
+    from .agents import AgentsAPI
+    from .client import OpenToCloseAPI
+    from .contacts import ContactsAPI
+    from .properties import PropertiesAPI
+    from .property_contacts import PropertyContactsAPI
+    from .property_documents import PropertyDocumentsAPI
+    from .property_emails import PropertyEmailsAPI
+    from .property_notes import PropertyNotesAPI
+    from .property_tasks import PropertyTasksAPI
+    from .tags import TagsAPI
+    from .teams import TeamsAPI
+    from .users import UsersAPI
+
+# Read .env when the package is imported, as before service clients became
+# lazy, so OPEN_TO_CLOSE_API_KEY is in os.environ before any client exists
+load_dotenv()
+
+# Service clients are imported on first access so that importing the package
+# does not pull in requests and the HTTP stack until a client is used.
+_LAZY_IMPORTS = {
+    "OpenToCloseAPI": ".client",
+    "AgentsAPI": ".agents",
+    "ContactsAPI": ".contacts",
+    "PropertiesAPI": ".properties",
+    "PropertyContactsAPI": ".property_contacts",
+    "PropertyDocumentsAPI": ".property_documents",
+    "PropertyEmailsAPI": ".property_emails",
+    "PropertyNotesAPI": ".property_notes",
+    "PropertyTasksAPI": ".property_tasks",
+    "TagsAPI": ".tags",
+    "TeamsAPI": ".teams",
+    "UsersAPI": ".users",
+}
 
 __version__ = "2.4.1"
 __all__ = [
@@ -53,3 +80,29 @@ __all__ = [
     "ConfigurationError",
     "DataFormatError",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import service clients lazily on first attribute access.
+
+    Args:
+        name: Attribute name being looked up
+
+    Returns:
+        The requested service client class
+
+    Raises:
+        AttributeError: If the attribute is not a known export
+    """
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """List module attributes including lazily imported service clients."""
+    return sorted(set(globals()) | set(__all__))
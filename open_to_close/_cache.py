@@ -0,0 +1,104 @@
+"""In-memory response cache for Open To Close API clients."""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+from .exceptions import ConfigurationError
+
+DEFAULT_CACHE_MAXSIZE = 1024
+
+
+def validate_ttl(ttl: Optional[float], option: str = "cache_ttl") -> Optional[float]:
+    """Validate a cache time-to-live setting.
+
+    Args:
+        ttl: Seconds entries stay valid, or None to disable caching
+        option: Name of the setting, used in the error message
+
+    Returns:
+        The TTL as a float, or None when caching is disabled
+
+    Raises:
+        ConfigurationError: If ttl is not a positive number
+    """
+    if ttl is None:
+        return None
+
+    if isinstance(ttl, bool) or not isinstance(ttl, (int, float)) or ttl <= 0:
+        raise ConfigurationError(f"Invalid {option}: {ttl}. Must be a positive number.")
+    return float(ttl)
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries expire after a fixed time-to-live.
+
+    Entries are evicted lazily on lookup once expired, and the least recently
+    used entry is dropped when the cache grows past ``maxsize``.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = DEFAULT_CACHE_MAXSIZE) -> None:
+        """Initialize the cache.
+
+        Args:
+            ttl: Seconds an entry stays valid after it is stored
+            maxsize: Maximum number of entries kept
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of stored entries, including expired ones."""
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for a key.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            The cached value, or None if the key is missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the least recently used entry if full.
+
+        Args:
+            key: Cache key
+            value: Value to store
+        """
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        """Remove a key from the cache if present.
+
+        Args:
+            key: Cache key
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,120 @@
+"""JSON backend used for request bodies and responses.
+
+The fastest installed library is selected at import time: orjson, then ujson,
+then the standard library. Set ``OPEN_TO_CLOSE_JSON_BACKEND`` to ``orjson``,
+``ujson`` or ``json`` to prefer a specific backend, for example to rule out a
+backend-specific encoding or decoding difference.
+
+Every backend encodes the same payloads the standard library accepts.
+Non-string keys are converted to strings. NaN and infinity are rejected with
+ValueError or OverflowError, and dates and other non-JSON types with
+TypeError.
+"""
+
+import json
+import logging
+import math
+import os
+from typing import Any, Tuple, Type
+
+logger = logging.getLogger(__name__)
+
+BACKENDS = ("orjson", "ujson", "json")
+
+# Exceptions raised by the selected backend for payloads it cannot encode
+ENCODE_ERRORS: Tuple[Type[Exception], ...] = (TypeError, ValueError, OverflowError)
+
+
+def _select_backend() -> str:
+    """Pick the JSON backend, honouring ``OPEN_TO_CLOSE_JSON_BACKEND``.
+
+    Returns:
+        Name of the first importable backend in preference order
+    """
+    preferred = os.environ.get("OPEN_TO_CLOSE_JSON_BACKEND", "").strip().lower()
+    if preferred and preferred not in BACKENDS:
+        logger.warning(
+            f"Unknown OPEN_TO_CLOSE_JSON_BACKEND: {preferred}. "
+            f"Must be one of: {', '.join(BACKENDS)}"
+        )
+        preferred = ""
+
+    order = (preferred,) + BACKENDS if preferred else BACKENDS
+    for name in order:
+        if name == "json":
+            return name
+        try:
+            __import__(name)
+        except ImportError:
+            continue
+        return name
+
+    return "json"  # pragma: no cover - loop always reaches "json"
+
+
+def _reject_non_finite(obj: Any) -> None:
+    """Raise for NaN or infinite floats anywhere in a payload.
+
+    Args:
+        obj: Payload to check
+
+    Raises:
+        ValueError: If the payload contains a non-finite float
+    """
+    if isinstance(obj, float):
+        if not math.isfinite(obj):
+            raise ValueError("Out of range float values are not JSON compliant")
+    elif isinstance(obj, dict):
+        for value in obj.values():
+            _reject_non_finite(value)
+    elif isinstance(obj, (list, tuple)):
+        for item in obj:
+            _reject_non_finite(item)
+
+
+BACKEND = _select_backend()
+
+if BACKEND == "orjson":
+    import orjson
+
+    # Leave dates and dataclasses unencoded so they fail as they do with json
+    _ORJSON_OPTIONS = (
+        orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+    )
+
+    def loads(data: bytes) -> Any:
+        """Decode JSON bytes."""
+        return orjson.loads(data)
+
+    def dumps(obj: Any) -> bytes:
+        """Encode an object as JSON bytes.
+
+        orjson writes NaN and infinity as null, so they are rejected first.
+        """
+        _reject_non_finite(obj)
+        return orjson.dumps(obj, option=_ORJSON_OPTIONS)
+
+elif BACKEND == "ujson":
+    import ujson
+
+    def loads(data: bytes) -> Any:
+        """Decode JSON bytes."""
+        return ujson.loads(data)
+
+    def dumps(obj: Any) -> bytes:
+        """Encode an object as JSON bytes."""
+        return ujson.dumps(
+            obj, ensure_ascii=False, escape_forward_slashes=False, allow_nan=False
+        ).encode("utf-8")
+
+else:
+
+    def loads(data: bytes) -> Any:
+        """Decode JSON bytes."""
+        return json.loads(data)
+
+    def dumps(obj: Any) -> bytes:
+        """Encode an object as JSON bytes."""
+        return json.dumps(obj, ensure_ascii=False, allow_nan=False).encode("utf-8")
@@ -3,6 +3,8 @@
 import logging
 from typing import Any, Dict, List, Optional
 
+import requests
+
 from .base_client import BaseClient
 from .exceptions import ValidationError
 
@@ -17,19 +19,23 @@ class AgentsAPI(BaseClient):
     """
 
     def __init__(
-        self, api_key: Optional[str] = None, base_url: Optional[str] = None
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        session: Optional[requests.Session] = None,
     ) -> None:
         """Initialize the agents client.
 
         Args:
             api_key: API key for authentication
             base_url: Base URL for the API
+            session: Existing session to share with other clients
 
         Raises:
             AuthenticationError: If API key is missing or invalid
             ConfigurationError: If configuration is invalid
         """
-        super().__init__(api_key=api_key, base_url=base_url)
+        super().__init__(api_key=api_key, base_url=base_url, session=session)
         logger.debug("Initialized AgentsAPI client")
 
     def _validate_agent_data(self, agent_data: Dict[str, Any], operation: str) -> None:
@@ -285,8 +291,9 @@ class AgentsAPI(BaseClient):
             validated_id = self._validate_resource_id(agent_id, "agent")
 
             logger.info(f"Retrieving agent with ID: {validated_id}")
-            response = self.get(f"/agents/{validated_id}")
-            result = self._process_response_data(response, f"/agents/{validated_id}")
+            endpoint = f"/agents/{validated_id}"
+            response = self.get(endpoint)
+            result = self._process_response_data(response, endpoint)
 
             logger.info(f"Successfully retrieved agent: {validated_id}")
             return result
@@ -333,8 +340,9 @@ class AgentsAPI(BaseClient):
                 f"Updating agent with ID: {validated_id}",
                 extra={"update_fields": list(agent_data.keys())},
             )
-            response = self.put(f"/agents/{validated_id}", json_data=agent_data)
-            result = self._process_response_data(response, f"/agents/{validated_id}")
+            endpoint = f"/agents/{validated_id}"
+            response = self.put(endpoint, json_data=agent_data)
+            result = self._process_response_data(response, endpoint)
 
             logger.info(f"Successfully updated agent: {validated_id}")
             return result
@@ -3,12 +3,25 @@
 import logging
 import os
 import time
-from typing import Any, Dict, List, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Union
 
 import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
 from requests.exceptions import ConnectionError, HTTPError, RequestException, Timeout
-
+from requests.structures import CaseInsensitiveDict
+from urllib3.util.retry import Retry
+
+try:
+    # Lists every encoding urllib3 can decode here, including br when a
+    # Brotli package is installed
+    from urllib3.util.request import ACCEPT_ENCODING
+except ImportError:  # pragma: no cover - urllib3 < 1.25
+    ACCEPT_ENCODING = "gzip,deflate"
+
+from . import _json
+from ._cache import DEFAULT_CACHE_MAXSIZE, TTLCache, validate_ttl
 from .exceptions import (
     AuthenticationError,
     ConfigurationError,
@@ -33,6 +46,158 @@ NON_V1_BASE_URL = "https://api.opentoclose.com"
 DEFAULT_TIMEOUT = 30.0
 MAX_RETRIES = 3
 RETRY_BACKOFF_FACTOR = 2.0
+POOL_CONNECTIONS = 10
+POOL_MAXSIZE = 20
+CONNECT_RETRIES = 2
+CONNECT_BACKOFF_FACTOR = 0.3
+DEFAULT_PAGE_SIZE = 100
+DEFAULT_PAGE_CONCURRENCY = 1
+BULK_MAX_WORKERS = 8
+ETAG_CACHE_MAXSIZE = 64
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _encode_json_body(
+    json_data: Union[Dict[str, Any], List[Dict[str, Any]]],
+) -> Optional[bytes]:
+    """Serialize a JSON request body with the fast JSON backend.
+
+    Args:
+        json_data: Request payload
+
+    Returns:
+        Encoded body, or None when no fast backend is installed or it cannot
+        encode the payload and ``requests`` should serialize it instead
+    """
+    if _json.BACKEND == "json":
+        return None
+
+    try:
+        return _json.dumps(json_data)
+    except _json.ENCODE_ERRORS:
+        return None
+
+
+class _JSONResponse(requests.Response):
+    """Response that decodes JSON bodies with the fast JSON backend."""
+
+    def json(self, **kwargs: Any) -> Any:
+        """Decode the response body as JSON.
+
+        orjson and ujson parse the raw body bytes directly, skipping the text
+        decode that ``requests`` performs before handing off to the stdlib
+        parser. The stdlib path is used when neither is installed, when
+        decoder keyword arguments are given, or when the backend rejects the
+        body.
+
+        Args:
+            **kwargs: Optional arguments passed through to ``json.loads``
+
+        Returns:
+            Decoded JSON data
+        """
+        if _json.BACKEND == "json" or kwargs:
+            return super().json(**kwargs)
+
+        try:
+            return _json.loads(self.content)
+        except ValueError:
+            return super().json()
+
+
+class _ClientAdapter(HTTPAdapter):
+    """HTTP adapter mounted on every client session.
+
+    When given an ETag cache, GET responses that carry an ``ETag`` are
+    remembered per URL, and repeat GETs send ``If-None-Match``. When the
+    server answers ``304 Not Modified`` the stored body is returned as a
+    regular 200 response, so callers never see the 304 and no body is
+    downloaded.
+    """
+
+    def __init__(
+        self, *args: Any, etag_cache: Optional[TTLCache] = None, **kwargs: Any
+    ) -> None:
+        """Initialize the adapter.
+
+        Args:
+            *args: Positional arguments passed to ``HTTPAdapter``
+            etag_cache: Cache of ``(etag, headers, body)`` per URL, or None to
+                send every GET unconditionally
+            **kwargs: Keyword arguments passed to ``HTTPAdapter``
+        """
+        super().__init__(*args, **kwargs)
+        self._etags = etag_cache
+
+    def send(
+        self,
+        request: requests.PreparedRequest,
+        stream: bool = False,
+        timeout: Any = None,
+        verify: Union[bool, str] = True,
+        cert: Any = None,
+        proxies: Optional[Mapping[str, str]] = None,
+    ) -> requests.Response:
+        """Send a request, revalidating cached GET bodies by ETag.
+
+        Args:
+            request: Prepared request to send
+            stream: Whether to defer downloading the body
+            timeout: Connect and read timeout
+            verify: TLS verification flag or CA bundle path
+            cert: Client certificate
+            proxies: Proxies to use for the request
+
+        Returns:
+            Response object; a 304 for a cached URL is replaced by the
+            stored 200 response
+        """
+        send = super().send
+        etags = self._etags
+        if (
+            etags is None
+            or request.method != "GET"
+            or "If-None-Match" in request.headers
+        ):
+            return send(request, stream, timeout, verify, cert, proxies)
+
+        cached = etags.get(request.url)
+        if cached is not None:
+            request.headers["If-None-Match"] = cached[0]
+
+        response = send(request, stream, timeout, verify, cert, proxies)
+
+        if response.status_code == 304 and cached is not None:
+            # Read the empty 304 body first so urllib3 releases the connection
+            # back to the pool before the stored body takes its place
+            response.content
+            _, headers, content = cached
+            response.status_code = 200
+            response.reason = "OK"
+            response.headers = CaseInsensitiveDict(headers)
+            response._content = content
+        elif response.status_code == 200 and "ETag" in response.headers and not stream:
+            etags.set(
+                request.url,
+                (response.headers["ETag"], dict(response.headers), response.content),
+            )
+        return response
+
+    def build_response(
+        self, req: requests.PreparedRequest, resp: Any
+    ) -> requests.Response:
+        """Build a response object that uses the fast JSON decoder.
+
+        Args:
+            req: Prepared request that produced the response
+            resp: Raw urllib3 response
+
+        Returns:
+            Response object with a fast-backend ``json()``
+        """
+        response = super().build_response(req, resp)
+        response.__class__ = _JSONResponse
+        return response
 
 
 class BaseClient:
@@ -45,6 +210,9 @@ class BaseClient:
         timeout: float = DEFAULT_TIMEOUT,
         max_retries: int = MAX_RETRIES,
         retry_backoff_factor: float = RETRY_BACKOFF_FACTOR,
+        pool_maxsize: int = POOL_MAXSIZE,
+        session: Optional[requests.Session] = None,
+        etag_cache_ttl: Optional[float] = None,
     ) -> None:
         """Initialize the base client.
 
@@ -54,6 +222,16 @@ class BaseClient:
             timeout: Request timeout in seconds
             max_retries: Maximum number of retry attempts
             retry_backoff_factor: Backoff factor for retries
+            pool_maxsize: Maximum number of keep-alive connections kept per host.
+                Set this to at least the number of threads sharing the client.
+            session: Existing session to reuse, typically one already set up by
+                another client so both share its keep-alive connection pool.
+                Sessions are safe to share between clients used from the same
+                threads. When omitted, a new pooled session is created.
+            etag_cache_ttl: Seconds to keep GET bodies that carry an ``ETag``
+                so repeat GETs are revalidated with ``If-None-Match`` instead
+                of downloaded again. Disabled by default. Only applies to the
+                session this client creates, not to one passed in.
 
         Raises:
             AuthenticationError: If API key is missing or invalid format
@@ -61,9 +239,19 @@ class BaseClient:
         """
         self._validate_and_set_api_key(api_key)
         self._validate_and_set_configuration(
-            base_url, timeout, max_retries, retry_backoff_factor
+            base_url, timeout, max_retries, retry_backoff_factor, pool_maxsize
+        )
+        etag_cache = self._create_response_cache(
+            etag_cache_ttl, ETAG_CACHE_MAXSIZE, "etag_cache_ttl"
         )
-        self._setup_session()
+        if session is None:
+            self._setup_session(etag_cache)
+        elif isinstance(session, requests.Session):
+            self.session = session
+        else:
+            raise ConfigurationError(
+                f"Invalid session: {session!r}. Must be a requests.Session."
+            )
 
         logger.info(
             "Initialized Open To Close API client",
@@ -104,6 +292,7 @@ class BaseClient:
         timeout: float,
         max_retries: int,
         retry_backoff_factor: float,
+        pool_maxsize: int = POOL_MAXSIZE,
     ) -> None:
         """Validate and set configuration parameters.
 
@@ -112,6 +301,7 @@ class BaseClient:
             timeout: Request timeout
             max_retries: Maximum retry attempts
             retry_backoff_factor: Backoff factor for retries
+            pool_maxsize: Maximum keep-alive connections per host
 
         Raises:
             ConfigurationError: If any configuration parameter is invalid
@@ -149,19 +339,79 @@ class BaseClient:
             )
         self.retry_backoff_factor = float(retry_backoff_factor)
 
-    def _setup_session(self) -> None:
-        """Set up the requests session with proper configuration."""
+        # Validate connection pool size
+        if not isinstance(pool_maxsize, int) or pool_maxsize < 1:
+            raise ConfigurationError(
+                f"Invalid pool_maxsize: {pool_maxsize}. Must be a positive integer."
+            )
+        self.pool_maxsize = pool_maxsize
+
+    def _setup_session(self, etag_cache: Optional[TTLCache] = None) -> None:
+        """Set up the requests session with proper configuration.
+
+        Args:
+            etag_cache: Cache used to revalidate repeat GETs by ETag, or None
+                to disable conditional requests
+        """
         self.session = requests.Session()
         self.session.headers.update(
             {
                 "Accept": "application/json",
+                "Accept-Encoding": ACCEPT_ENCODING,
                 "Content-Type": "application/json",
                 "User-Agent": "open-to-close-python-client/1.0.0",
             }
         )
 
+        # Connection setup failures are retried inside the pool by urllib3. No
+        # request bytes have been sent at that point, so this is safe for every
+        # method. Status-based retries (429/5xx) stay in _request so they surface
+        # as typed exceptions and honour Retry-After.
+        retry = Retry(
+            total=CONNECT_RETRIES,
+            connect=CONNECT_RETRIES,
+            read=0,
+            status=0,
+            backoff_factor=CONNECT_BACKOFF_FACTOR,
+            respect_retry_after_header=False,
+            raise_on_status=False,
+        )
+        adapter = _ClientAdapter(
+            pool_connections=POOL_CONNECTIONS,
+            pool_maxsize=self.pool_maxsize,
+            max_retries=retry,
+            etag_cache=etag_cache,
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
         # Session timeout is configured per request in the _request method
 
+    def _create_response_cache(
+        self,
+        cache_ttl: Optional[float],
+        maxsize: int = DEFAULT_CACHE_MAXSIZE,
+        option: str = "cache_ttl",
+    ) -> Optional[TTLCache]:
+        """Create a cache for GET responses.
+
+        Args:
+            cache_ttl: Seconds a retrieved resource is reused before it is
+                fetched again, or None to disable caching
+            maxsize: Maximum number of entries kept
+            option: Name of the setting, used in the error message
+
+        Returns:
+            A TTLCache, or None when caching is disabled
+
+        Raises:
+            ConfigurationError: If cache_ttl is not a positive number
+        """
+        ttl = validate_ttl(cache_ttl, option)
+        if ttl is None:
+            return None
+        return TTLCache(ttl, maxsize)
+
     def _get_base_url_for_operation(self, method: str, endpoint: str) -> str:
         """Get the appropriate base URL based on operation type and endpoint.
 
@@ -235,6 +485,70 @@ class BaseClient:
                 f"{resource_type} ID must be a valid integer, got {type(resource_id).__name__}: {resource_id}"
             )
 
+    def _validate_pagination_params(
+        self, params: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Validate list parameters and normalize shared pagination values.
+
+        Resource clients call this from their ``_validate_list_params`` before
+        checking resource-specific filters.
+
+        Args:
+            params: Parameters to validate
+
+        Returns:
+            Copy of the parameters with ``limit`` and ``offset`` as integers
+
+        Raises:
+            ValidationError: If parameters are not a dictionary or pagination
+                values are invalid
+        """
+        if params is None:
+            return {}
+
+        if not isinstance(params, dict):
+            raise ValidationError(
+                f"List parameters must be a dictionary, got {type(params).__name__}"
+            )
+
+        validated_params = params.copy()
+
+        # Validate limit parameter
+        if "limit" in validated_params:
+            limit = validated_params["limit"]
+            try:
+                limit_int = int(limit)
+                if limit_int <= 0:
+                    raise ValidationError(
+                        f"Limit must be a positive integer, got {limit_int}"
+                    )
+                if limit_int > 1000:  # Reasonable upper bound
+                    logger.warning(
+                        f"Large limit value: {limit_int}. Consider using pagination."
+                    )
+                validated_params["limit"] = limit_int
+            except (ValueError, TypeError):
+                raise ValidationError(
+                    f"Limit must be an integer, got {type(limit).__name__}: {limit}"
+                )
+
+        # Validate offset parameter
+        if "offset" in validated_params:
+            offset = validated_params["offset"]
+            try:
+                offset_int = int(offset)
+                if offset_int < 0:
+                    raise ValidationError(
+                        f"Offset must be non-negative, got {offset_int}"
+                    )
+                validated_params["offset"] = offset_int
+            except (ValueError, TypeError):
+                raise ValidationError(
+                    f"Offset must be an integer, got {type(offset).__name__}: {offset}"
+                )
+
+        return validated_params
+
     def _validate_request_data(self, data: Any, endpoint: str) -> None:
         """Validate request data before sending.
 
@@ -325,33 +639,38 @@ class BaseClient:
         Raises:
             Various OpenToCloseAPIError subclasses based on response
         """
+        status_code = response.status_code
+
+        # 204 No Content has no body to parse
+        if status_code == 204:
+            logger.debug(
+                f"Received empty response from {method} {endpoint}",
+                extra={"status_code": status_code, "response_size": 0},
+            )
+            response.close()
+            return {}
+
         # Parse response data safely
+        content = response.content
         try:
-            response_data = response.json() if response.content else {}
+            response_data = response.json() if content else {}
         except ValueError as e:
             logger.warning(f"Failed to parse JSON response: {e}")
             response_data = {"message": response.text, "raw_content": response.text}
 
         # Log response for debugging
         try:
-            response_size = (
-                len(response.content)
-                if hasattr(response, "content") and response.content
-                else 0
-            )
-        except (TypeError, AttributeError):
+            response_size = len(content) if content else 0
+        except TypeError:
             response_size = 0
 
         logger.debug(
             f"Received response from {method} {endpoint}",
-            extra={
-                "status_code": getattr(response, "status_code", 0),
-                "response_size": response_size,
-            },
+            extra={"status_code": status_code, "response_size": response_size},
         )
 
         # Handle successful responses
-        if response.status_code in (200, 201):
+        if status_code in (200, 201):
             # Check if we got HTML instead of JSON (indicates auth redirect or server error)
             content_type = response.headers.get("content-type", "").lower()
             if "text/html" in content_type:
@@ -362,7 +681,7 @@ class BaseClient:
                 ):
                     raise ServerError(
                         f"Server returned HTML error page for {method} {endpoint}. The endpoint may not be available or implemented.",
-                        status_code=response.status_code,
+                        status_code=status_code,
                         response_data={
                             "message": "Server error returned as HTML",
                             "content_type": content_type,
@@ -373,7 +692,7 @@ class BaseClient:
                 else:
                     raise AuthenticationError(
                         f"Received HTML login page instead of JSON for {method} {endpoint}. Check authentication or endpoint availability.",
-                        status_code=response.status_code,
+                        status_code=status_code,
                         response_data={
                             "message": "Authentication required",
                             "content_type": content_type,
@@ -382,18 +701,16 @@ class BaseClient:
                         method=method,
                     )
             return response_data
-        if response.status_code == 204:
-            return {}
 
         # Enhanced error handling with context
         error_kwargs = {
-            "status_code": response.status_code,
+            "status_code": status_code,
             "response_data": response_data,
             "endpoint": endpoint,
             "method": method,
         }
 
-        if response.status_code == 400:
+        if status_code == 400:
             # Extract field-specific errors if available
             field_errors = None
             if isinstance(response_data, dict):
@@ -407,23 +724,23 @@ class BaseClient:
                 **error_kwargs,
             )
 
-        elif response.status_code == 401:
+        elif status_code == 401:
             message = response_data.get("message", "Invalid credentials")
             raise AuthenticationError(
                 f"Authentication failed for {method} {endpoint}: {message}",
                 **error_kwargs,
             )
 
-        elif response.status_code == 404:
+        elif status_code == 404:
             raise NotFoundError(
                 f"Resource not found for {method} {endpoint}: {response_data.get('message', 'Not found')}",
-                status_code=response.status_code,
+                status_code=status_code,
                 response_data=response_data,
                 endpoint=endpoint,
                 method=method,
             )
 
-        elif response.status_code == 429:
+        elif status_code == 429:
             message = response_data.get("message", "Too many requests")
             retry_after = None
             if "retry-after" in response.headers:
@@ -438,7 +755,7 @@ class BaseClient:
                 **error_kwargs,
             )
 
-        elif 500 <= response.status_code < 600:
+        elif 500 <= status_code < 600:
             message = response_data.get("message", "Internal server error")
             raise ServerError(
                 f"Server error for {method} {endpoint}: {message}",
@@ -448,7 +765,7 @@ class BaseClient:
         # Generic error for other status codes
         raise OpenToCloseAPIError(
             f"Unexpected error for {method} {endpoint}: {response_data.get('message', 'Unknown error')}",
-            status_code=response.status_code,
+            status_code=status_code,
             response_data=response_data,
             endpoint=endpoint,
             method=method,
@@ -469,6 +786,18 @@ class BaseClient:
         Raises:
             DataFormatError: If response format is unexpected
         """
+        # Fast path: the JSON decoder only produces exact dicts, so an identity
+        # type check covers the common shapes without an isinstance walk. Most
+        # item responses carry an ID, so subscripting first skips a .get call.
+        if type(response) is dict:
+            try:
+                if response["id"]:
+                    return response
+            except KeyError:
+                data = response.get("data")
+                if type(data) is dict:
+                    return data
+
         if not isinstance(response, dict):
             raise DataFormatError(
                 f"Expected dictionary response from {endpoint}",
@@ -494,7 +823,7 @@ class BaseClient:
         return response
 
     def _process_list_response(
-        self, response: Dict[str, Any], endpoint: str
+        self, response: Union[Dict[str, Any], List[Dict[str, Any]]], endpoint: str
     ) -> List[Dict[str, Any]]:
         """Process API response for list endpoints with consistent format handling and validation.
 
@@ -508,6 +837,14 @@ class BaseClient:
         Raises:
             DataFormatError: If response format is unexpected
         """
+        # Fast path for the exact list/dict shapes produced by the JSON decoder
+        if type(response) is list:
+            return response
+        if type(response) is dict:
+            data = response.get("data")
+            if type(data) is list:
+                return data
+
         # Handle direct list responses
         if isinstance(response, list):
             return response
@@ -540,6 +877,158 @@ class BaseClient:
             endpoint=endpoint,
         )
 
+    def _iter_list_pages(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        concurrency: int = 1,
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield items from a list endpoint one page at a time.
+
+        Pages are requested with ``limit``/``offset`` so only a few pages are
+        held in memory, and callers that stop iterating early never fetch the
+        remaining pages. Iteration ends on the first short page.
+
+        With ``concurrency`` above one, the first page is fetched on its own
+        and, if it is full, later pages are fetched in concurrent batches over
+        the shared session. Items are still yielded in page order; a batch may
+        request up to ``concurrency - 1`` pages past the end of the list.
+
+        Args:
+            endpoint: List endpoint to page through
+            params: Validated query parameters; ``offset`` sets the starting
+                position and ``limit`` is replaced by ``page_size``
+            page_size: Number of items to request per page
+            concurrency: Maximum number of pages requested at once
+
+        Yields:
+            Individual items from each page
+
+        Raises:
+            DataFormatError: If a page has an unexpected format
+        """
+        base_params = dict(params or {})
+        offset = base_params.get("offset", 0)
+        previous_first: Optional[Dict[str, Any]] = None
+        concurrency = min(concurrency, self.pool_maxsize)
+
+        def fetch_page(page_offset: int) -> List[Dict[str, Any]]:
+            page_params = {**base_params, "limit": page_size, "offset": page_offset}
+            return self._process_list_response(
+                self.get(endpoint, params=page_params), endpoint
+            )
+
+        executor = (
+            ThreadPoolExecutor(max_workers=concurrency) if concurrency > 1 else None
+        )
+        batch_size = 1
+        try:
+            while True:
+                offsets = [offset + i * page_size for i in range(batch_size)]
+                if executor is None:
+                    pages: Iterator[List[Dict[str, Any]]] = map(fetch_page, offsets)
+                else:
+                    pages = executor.map(fetch_page, offsets)
+
+                for page in pages:
+                    if not page:
+                        return
+
+                    # Guard against endpoints that ignore offset and repeat a page
+                    if page[0] == previous_first:
+                        return
+                    previous_first = page[0]
+
+                    yield from page
+
+                    if len(page) != page_size:
+                        return
+
+                offset += batch_size * page_size
+                batch_size = concurrency
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True)
+
+    def _validate_worker_count(self, value: int, name: str) -> int:
+        """Validate a concurrency setting.
+
+        Args:
+            value: Requested number of concurrent requests
+            name: Parameter name for error context
+
+        Returns:
+            The validated value
+
+        Raises:
+            ValidationError: If value is not a positive integer
+        """
+        if isinstance(value, bool) or not isinstance(value, int) or value < 1:
+            raise ValidationError(f"{name} must be a positive integer, got: {value}")
+        return value
+
+    def _run_bulk(
+        self,
+        operation: Callable[[Any], Dict[str, Any]],
+        resource_ids: List[int],
+        resource_type: str,
+        max_workers: int = BULK_MAX_WORKERS,
+    ) -> Dict[Any, Union[Dict[str, Any], OpenToCloseAPIError]]:
+        """Run a single-resource operation for many IDs concurrently.
+
+        Workers share this client's session, so requests reuse pooled
+        keep-alive connections; concurrency is capped at the pool size.
+        Failures are collected per ID instead of aborting the batch.
+
+        Args:
+            operation: Callable taking one resource ID
+            resource_ids: IDs to run the operation for; duplicates run once
+            resource_type: Resource type for error context
+            max_workers: Maximum number of concurrent requests
+
+        Returns:
+            Dictionary mapping each ID to the operation's result, or to the
+            OpenToCloseAPIError raised for that ID
+
+        Raises:
+            ValidationError: If resource_ids is not a list or max_workers is
+                not a positive integer
+        """
+        if not isinstance(resource_ids, (list, tuple)):
+            raise ValidationError(
+                f"{resource_type} IDs must be a list, got {type(resource_ids).__name__}"
+            )
+
+        self._validate_worker_count(max_workers, "max_workers")
+
+        unique_ids = list(dict.fromkeys(resource_ids))
+        results: Dict[Any, Union[Dict[str, Any], OpenToCloseAPIError]] = {}
+        if not unique_ids:
+            return results
+
+        def run(resource_id: Any) -> Union[Dict[str, Any], OpenToCloseAPIError]:
+            try:
+                return operation(resource_id)
+            except OpenToCloseAPIError as e:
+                return e
+
+        workers = min(max_workers, self.pool_maxsize, len(unique_ids))
+        logger.debug(
+            f"Running bulk operation for {len(unique_ids)} {resource_type}s",
+            extra={"workers": workers},
+        )
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for resource_id, result in zip(unique_ids, executor.map(run, unique_ids)):
+                results[resource_id] = result
+
+        failed = sum(isinstance(r, OpenToCloseAPIError) for r in results.values())
+        if failed:
+            logger.warning(
+                f"Bulk operation failed for {failed} of {len(results)} {resource_type}s"
+            )
+        return results
+
     def _request(
         self,
         method: str,
@@ -574,43 +1063,63 @@ class BaseClient:
         base_url = self._get_base_url_for_operation(method, endpoint)
         url = f"{base_url}/{endpoint.lstrip('/')}"
 
-        # Add api_token to params for all requests
-        if params is None:
-            params = {}
-        params["api_token"] = self.api_key
+        # Add api_token to a fresh params dict so the caller's dict is untouched
+        params = (
+            {**params, "api_token": self.api_key}
+            if params
+            else {"api_token": self.api_key}
+        )
 
-        # Log request details
-        try:
-            params_count = len(params) if params and hasattr(params, "__len__") else 0
-        except (TypeError, AttributeError):
-            params_count = 0
+        # Log request details, skipping the context build when INFO is disabled
+        if logger.isEnabledFor(logging.INFO):
+            try:
+                params_count = (
+                    len(params) if params and hasattr(params, "__len__") else 0
+                )
+            except (TypeError, AttributeError):
+                params_count = 0
+
+            logger.info(
+                f"Making {method} request to {endpoint}",
+                extra={
+                    "url": url,
+                    "has_json_data": json_data is not None,
+                    "has_form_data": data is not None,
+                    "has_files": files is not None,
+                    "params_count": params_count,
+                },
+            )
 
-        logger.info(
-            f"Making {method} request to {endpoint}",
-            extra={
-                "url": url,
-                "has_json_data": json_data is not None,
-                "has_form_data": data is not None,
-                "has_files": files is not None,
-                "params_count": params_count,
-            },
-        )
+        # Send JSON payloads as pre-encoded bytes. The Content-Type is set on
+        # the request because a session passed in by the caller may not carry
+        # the application/json default
+        body: Optional[Union[Dict[str, Any], bytes]] = data
+        headers = None
+        if json_data is not None and data is None and files is None:
+            encoded_body = _encode_json_body(json_data)
+            if encoded_body is not None:
+                body, json_data, headers = encoded_body, None, JSON_HEADERS
+
+        # Resolve the bound methods once rather than on every attempt
+        send_request = self.session.request
+        handle_response = self._handle_response
 
         # Retry logic
         last_exception: Optional[Exception] = None
         for attempt in range(1, self.max_retries + 1):
             try:
-                response = self.session.request(
+                response = send_request(
                     method=method,
                     url=url,
                     json=json_data,
-                    data=data,
+                    data=body,
                     files=files,
+                    headers=headers,
                     params=params,
                     timeout=self.timeout,
                 )
 
-                return self._handle_response(response, endpoint, method)
+                return handle_response(response, endpoint, method)
 
             except (ConnectionError, Timeout) as e:
                 last_exception = NetworkError(
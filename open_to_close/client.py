@@ -1,17 +1,28 @@
-from typing import Any, Dict, List, Optional
-
-from .agents import AgentsAPI
-from .base_client import DEFAULT_BASE_URL
-from .contacts import ContactsAPI
-from .properties import PropertiesAPI
-from .property_contacts import PropertyContactsAPI
-from .property_documents import PropertyDocumentsAPI
-from .property_emails import PropertyEmailsAPI
-from .property_notes import PropertyNotesAPI
-from .property_tasks import PropertyTasksAPI
-from .tags import TagsAPI
-from .teams import TeamsAPI
-from .users import UsersAPI
+"""Main client for Open To Close API."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Type, TypeVar
+
+from ._cache import validate_ttl
+
+if TYPE_CHECKING:
+    import requests
+
+    from .agents import AgentsAPI
+    from .base_client import BaseClient
+    from .contacts import ContactsAPI
+    from .properties import PropertiesAPI
+    from .property_contacts import PropertyContactsAPI
+    from .property_documents import PropertyDocumentsAPI
+    from .property_emails import PropertyEmailsAPI
+    from .property_notes import PropertyNotesAPI
+    from .property_tasks import PropertyTasksAPI
+    from .tags import TagsAPI
+    from .teams import TeamsAPI
+    from .users import UsersAPI
+
+_ClientT = TypeVar("_ClientT", bound="BaseClient")
 
 
 class OpenToCloseAPI:
@@ -19,6 +30,8 @@ class OpenToCloseAPI:
 
     This client provides access to all Open To Close API endpoints through
     service-specific clients using a composition pattern with lazy initialization.
+    All service clients share one HTTP session, so requests to different
+    endpoints reuse the same keep-alive connections.
 
     Example:
         ```python
@@ -43,7 +56,11 @@ class OpenToCloseAPI:
     """
 
     def __init__(
-        self, api_key: Optional[str] = None, base_url: Optional[str] = None
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        cache_ttl: Optional[float] = None,
+        etag_cache_ttl: Optional[float] = None,
     ) -> None:
         """Initialize the client.
 
@@ -53,14 +70,26 @@ class OpenToCloseAPI:
                      variable.
             base_url: Base URL for the Open To Close API. Defaults to
                       https://api.opentoclose.com/v1
+            cache_ttl: Seconds to reuse teams and users fetched by ID before
+                       requesting them again. Caching is disabled by default.
+            etag_cache_ttl: Seconds to keep GET responses that carry an ETag
+                            so repeat requests are revalidated with
+                            If-None-Match instead of downloaded again.
+                            Disabled by default.
 
         Raises:
             AuthenticationError: If API key is not provided and not found in environment
+            ConfigurationError: If cache_ttl or etag_cache_ttl is not a positive
+                number
         """
         self._api_key = api_key
-        self._base_url = base_url or DEFAULT_BASE_URL
+        self._base_url = base_url
+        self._cache_ttl = validate_ttl(cache_ttl)
+        self._etag_cache_ttl = validate_ttl(etag_cache_ttl, "etag_cache_ttl")
+        self._session: Optional[requests.Session] = None
 
-        # Lazy initialization of service clients
+        # Lazy initialization of service clients. Service modules are imported
+        # on first access so requests is only loaded once a client is used.
         self._agents: Optional[AgentsAPI] = None
         self._contacts: Optional[ContactsAPI] = None
         self._properties: Optional[PropertiesAPI] = None
@@ -73,6 +102,39 @@ class OpenToCloseAPI:
         self._teams: Optional[TeamsAPI] = None
         self._users: Optional[UsersAPI] = None
 
+    def _init_client(self, client_class: Type[_ClientT], **kwargs: Any) -> _ClientT:
+        """Create a service client that shares this client's HTTP session.
+
+        The first service client sets up the pooled session; every later one
+        reuses it instead of opening its own connections.
+
+        Args:
+            client_class: Service client class to instantiate
+            **kwargs: Additional client-specific keyword arguments
+
+        Returns:
+            Initialized service client
+        """
+        if self._session is None and self._etag_cache_ttl is not None:
+            # Service clients take no ETag setting, so build the shared
+            # session with the ETag cache enabled before handing it out
+            from .base_client import BaseClient
+
+            self._session = BaseClient(
+                api_key=self._api_key,
+                base_url=self._base_url,
+                etag_cache_ttl=self._etag_cache_ttl,
+            ).session
+
+        client = client_class(
+            api_key=self._api_key,
+            base_url=self._base_url,
+            session=self._session,
+            **kwargs,
+        )
+        self._session = client.session
+        return client
+
     @property
     def agents(self) -> AgentsAPI:
         """Access to agents endpoints.
@@ -81,7 +143,9 @@ class OpenToCloseAPI:
             AgentsAPI instance for managing agents
         """
         if self._agents is None:
-            self._agents = AgentsAPI(api_key=self._api_key, base_url=self._base_url)
+            from .agents import AgentsAPI
+
+            self._agents = self._init_client(AgentsAPI)
         return self._agents
 
     @property
@@ -92,7 +156,9 @@ class OpenToCloseAPI:
             ContactsAPI instance for managing contacts
         """
         if self._contacts is None:
-            self._contacts = ContactsAPI(api_key=self._api_key, base_url=self._base_url)
+            from .contacts import ContactsAPI
+
+            self._contacts = self._init_client(ContactsAPI)
         return self._contacts
 
     @property
@@ -103,9 +169,9 @@ class OpenToCloseAPI:
             PropertiesAPI instance for managing properties
         """
         if self._properties is None:
-            self._properties = PropertiesAPI(
-                api_key=self._api_key, base_url=self._base_url
-            )
+            from .properties import PropertiesAPI
+
+            self._properties = self._init_client(PropertiesAPI)
         return self._properties
 
     @property
@@ -116,9 +182,9 @@ class OpenToCloseAPI:
             PropertyContactsAPI instance for managing property contacts
         """
         if self._property_contacts is None:
-            self._property_contacts = PropertyContactsAPI(
-                api_key=self._api_key, base_url=self._base_url
-            )
+            from .property_contacts import PropertyContactsAPI
+
+            self._property_contacts = self._init_client(PropertyContactsAPI)
         return self._property_contacts
 
     @property
@@ -129,9 +195,9 @@ class OpenToCloseAPI:
             PropertyDocumentsAPI instance for managing property documents
         """
         if self._property_documents is None:
-            self._property_documents = PropertyDocumentsAPI(
-                api_key=self._api_key, base_url=self._base_url
-            )
+            from .property_documents import PropertyDocumentsAPI
+
+            self._property_documents = self._init_client(PropertyDocumentsAPI)
         return self._property_documents
 
     @property
@@ -142,9 +208,9 @@ class OpenToCloseAPI:
             PropertyEmailsAPI instance for managing property emails
         """
         if self._property_emails is None:
-            self._property_emails = PropertyEmailsAPI(
-                api_key=self._api_key, base_url=self._base_url
-            )
+            from .property_emails import PropertyEmailsAPI
+
+            self._property_emails = self._init_client(PropertyEmailsAPI)
         return self._property_emails
 
     @property
@@ -155,9 +221,9 @@ class OpenToCloseAPI:
             PropertyNotesAPI instance for managing property notes
         """
         if self._property_notes is None:
-            self._property_notes = PropertyNotesAPI(
-                api_key=self._api_key, base_url=self._base_url
-            )
+            from .property_notes import PropertyNotesAPI
+
+            self._property_notes = self._init_client(PropertyNotesAPI)
         return self._property_notes
 
     @property
@@ -168,9 +234,9 @@ class OpenToCloseAPI:
             PropertyTasksAPI instance for managing property tasks
         """
         if self._property_tasks is None:
-            self._property_tasks = PropertyTasksAPI(
-                api_key=self._api_key, base_url=self._base_url
-            )
+            from .property_tasks import PropertyTasksAPI
+
+            self._property_tasks = self._init_client(PropertyTasksAPI)
         return self._property_tasks
 
     @property
@@ -181,7 +247,9 @@ class OpenToCloseAPI:
             TagsAPI instance for managing tags
         """
         if self._tags is None:
-            self._tags = TagsAPI(api_key=self._api_key, base_url=self._base_url)
+            from .tags import TagsAPI
+
+            self._tags = self._init_client(TagsAPI)
         return self._tags
 
     @property
@@ -192,7 +260,9 @@ class OpenToCloseAPI:
             TeamsAPI instance for managing teams
         """
         if self._teams is None:
-            self._teams = TeamsAPI(api_key=self._api_key, base_url=self._base_url)
+            from .teams import TeamsAPI
+
+            self._teams = self._init_client(TeamsAPI, cache_ttl=self._cache_ttl)
         return self._teams
 
     @property
@@ -203,7 +273,9 @@ class OpenToCloseAPI:
             UsersAPI instance for managing users
         """
         if self._users is None:
-            self._users = UsersAPI(api_key=self._api_key, base_url=self._base_url)
+            from .users import UsersAPI
+
+            self._users = self._init_client(UsersAPI, cache_ttl=self._cache_ttl)
         return self._users
 
     def get_property_fields(self) -> List[Dict[str, Any]]:
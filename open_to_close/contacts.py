@@ -3,6 +3,8 @@
 import logging
 from typing import Any, Dict, List, Optional
 
+import requests
+
 from .base_client import BaseClient
 from .exceptions import ValidationError
 
@@ -17,19 +19,23 @@ class ContactsAPI(BaseClient):
     """
 
     def __init__(
-        self, api_key: Optional[str] = None, base_url: Optional[str] = None
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        session: Optional[requests.Session] = None,
     ) -> None:
         """Initialize the contacts client.
 
         Args:
             api_key: API key for authentication
             base_url: Base URL for the API
+            session: Existing session to share with other clients
 
         Raises:
             AuthenticationError: If API key is missing or invalid
             ConfigurationError: If configuration is invalid
         """
-        super().__init__(api_key=api_key, base_url=base_url)
+        super().__init__(api_key=api_key, base_url=base_url, session=session)
         logger.debug("Initialized ContactsAPI client")
 
     def _validate_contact_data(
@@ -306,8 +312,9 @@ class ContactsAPI(BaseClient):
             validated_id = self._validate_resource_id(contact_id, "contact")
 
             logger.info(f"Retrieving contact with ID: {validated_id}")
-            response = self.get(f"/contacts/{validated_id}")
-            result = self._process_response_data(response, f"/contacts/{validated_id}")
+            endpoint = f"/contacts/{validated_id}"
+            response = self.get(endpoint)
+            result = self._process_response_data(response, endpoint)
 
             logger.info(f"Successfully retrieved contact: {validated_id}")
             return result
@@ -358,8 +365,9 @@ class ContactsAPI(BaseClient):
                 f"Updating contact with ID: {validated_id}",
                 extra={"update_fields": list(contact_data.keys())},
             )
-            response = self.put(f"/contacts/{validated_id}", json_data=contact_data)
-            result = self._process_response_data(response, f"/contacts/{validated_id}")
+            endpoint = f"/contacts/{validated_id}"
+            response = self.put(endpoint, json_data=contact_data)
+            result = self._process_response_data(response, endpoint)
 
             logger.info(f"Successfully updated contact: {validated_id}")
             return result
@@ -3,6 +3,8 @@
 import logging
 from typing import Any, Dict, List, Optional, Union
 
+import requests
+
 from .base_client import BaseClient
 from .exceptions import ValidationError
 
@@ -16,20 +18,55 @@ class PropertiesAPI(BaseClient):
     All methods include comprehensive input validation and error handling.
     """
 
+    _FIELD_MAPPINGS: Dict[str, Dict[str, Any]] = {
+        "contract_title": {"id": 926565, "key": "contract_title"},
+        "client_type": {
+            "id": 926553,
+            "key": "contract_client_type",
+            "options": {"buyer": 797212, "seller": 797213, "dual": 797214},
+        },
+        "status": {
+            "id": 926552,
+            "key": "contract_status",
+            "options": {
+                "pre-mls": 797205,
+                "active": 797206,
+                "under contract": 797207,
+                "withdrawn": 797208,
+                "contract": 797209,
+                "closed": 797210,
+                "terminated": 797211,
+            },
+        },
+        "purchase_amount": {"id": 926554, "key": "purchase_amount"},
+    }
+
+    # Allowed option IDs for choice fields, keyed by both field ID and key
+    _FIELD_OPTION_VALUES: Dict[Any, frozenset] = {
+        identifier: frozenset(mapping["options"].values())
+        for mapping in _FIELD_MAPPINGS.values()
+        if "options" in mapping
+        for identifier in (mapping["id"], mapping["key"])
+    }
+
     def __init__(
-        self, api_key: Optional[str] = None, base_url: Optional[str] = None
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        session: Optional[requests.Session] = None,
     ) -> None:
         """Initialize the properties client.
 
         Args:
             api_key: API key for authentication
             base_url: Base URL for the API
+            session: Existing session to share with other clients
 
         Raises:
             AuthenticationError: If API key is missing or invalid
             ConfigurationError: If configuration is invalid
         """
-        super().__init__(api_key=api_key, base_url=base_url)
+        super().__init__(api_key=api_key, base_url=base_url, session=session)
         logger.debug("Initialized PropertiesAPI client")
 
     def _validate_property_data(
@@ -65,14 +102,7 @@ class PropertiesAPI(BaseClient):
             elif "fields" in property_data and isinstance(
                 property_data["fields"], list
             ):
-                for field in property_data["fields"]:
-                    if isinstance(field, dict):
-                        if (
-                            field.get("key") == "contract_title"
-                            or field.get("id") == 926565
-                        ):
-                            has_title = True
-                            break
+                has_title = self._find_title_field(property_data["fields"]) is not None
 
             if not has_title:
                 raise ValidationError(
@@ -203,30 +233,10 @@ class PropertiesAPI(BaseClient):
         """Get field ID and option mappings for the API.
 
         Returns:
-            Dictionary containing field mappings and option values
+            Dictionary containing field mappings and option values. The
+            mapping is shared by all instances and must not be modified.
         """
-        return {
-            "contract_title": {"id": 926565, "key": "contract_title"},
-            "client_type": {
-                "id": 926553,
-                "key": "contract_client_type",
-                "options": {"buyer": 797212, "seller": 797213, "dual": 797214},
-            },
-            "status": {
-                "id": 926552,
-                "key": "contract_status",
-                "options": {
-                    "pre-mls": 797205,
-                    "active": 797206,
-                    "under contract": 797207,
-                    "withdrawn": 797208,
-                    "contract": 797209,
-                    "closed": 797210,
-                    "terminated": 797211,
-                },
-            },
-            "purchase_amount": {"id": 926554, "key": "purchase_amount"},
-        }
+        return self._FIELD_MAPPINGS
 
     def _get_team_member_id(self) -> int:
         """Auto-detect a valid team member ID.
@@ -241,7 +251,10 @@ class PropertiesAPI(BaseClient):
             # Import here to avoid circular imports
             from .teams import TeamsAPI
 
-            teams_client = TeamsAPI(api_key=self.api_key, base_url=self.base_url)
+            # Share this client's session so the lookup reuses its open connections
+            teams_client = TeamsAPI(
+                api_key=self.api_key, base_url=self.base_url, session=self.session
+            )
             teams = teams_client.list_teams()
 
             for team in teams:
@@ -256,6 +269,74 @@ class PropertiesAPI(BaseClient):
             logger.warning(f"Could not auto-detect team member, using fallback: {e}")
             return 26392  # John Barry - known working ID
 
+    def _find_title_field(self, fields: List[Any]) -> Optional[Dict[str, Any]]:
+        """Find the contract title entry in an API-format fields array.
+
+        Args:
+            fields: Fields array from API-format property data
+
+        Returns:
+            The first field matching the contract title key or ID, or None
+        """
+        return next(
+            (
+                field
+                for field in fields
+                if isinstance(field, dict)
+                and (field.get("key") == "contract_title" or field.get("id") == 926565)
+            ),
+            None,
+        )
+
+    def _validate_api_fields(self, fields: List[Any]) -> None:
+        """Validate known field values in an API-format fields array.
+
+        Choice fields are checked against their option IDs and numeric fields
+        against their type, so bad values fail locally instead of in a
+        rejected API request. Fields not in the mappings are passed through.
+
+        Args:
+            fields: Fields array from API-format property data
+
+        Raises:
+            ValidationError: If an entry is not a dictionary or a known field
+                has an invalid value
+        """
+        title_ids = (self._FIELD_MAPPINGS["contract_title"]["id"], "contract_title")
+        amount_ids = (self._FIELD_MAPPINGS["purchase_amount"]["id"], "purchase_amount")
+
+        for index, field in enumerate(fields):
+            if not isinstance(field, dict):
+                raise ValidationError(
+                    f"fields[{index}] must be a dictionary, got {type(field).__name__}"
+                )
+
+            identifier = field.get("id", field.get("key"))
+            value = field.get("value")
+
+            allowed = self._FIELD_OPTION_VALUES.get(identifier)
+            if allowed is not None:
+                if value not in allowed:
+                    raise ValidationError(
+                        f"fields[{index}] has invalid option {value!r} for field "
+                        f"{identifier}. Must be one of: "
+                        f"{', '.join(str(option) for option in sorted(allowed))}"
+                    )
+            elif identifier in title_ids:
+                if not isinstance(value, str) or len(value.strip()) == 0:
+                    raise ValidationError(
+                        f"fields[{index}] title must be a non-empty string, got: {value}"
+                    )
+            elif identifier in amount_ids:
+                if (
+                    isinstance(value, bool)
+                    or not isinstance(value, (int, float))
+                    or value < 0
+                ):
+                    raise ValidationError(
+                        f"fields[{index}] purchase amount must be a non-negative number, got: {value}"
+                    )
+
     def _extract_title_from_data(
         self, property_data: Union[str, Dict[str, Any]]
     ) -> str:
@@ -278,13 +359,9 @@ class PropertiesAPI(BaseClient):
 
             # Check fields array
             if "fields" in property_data:
-                for field in property_data["fields"]:
-                    if isinstance(field, dict):
-                        if (
-                            field.get("key") == "contract_title"
-                            or field.get("id") == 926565
-                        ):
-                            return str(field.get("value", "Unknown"))
+                title_field = self._find_title_field(property_data["fields"])
+                if title_field is not None:
+                    return str(title_field.get("value", "Unknown"))
 
         return "Unknown"
 
@@ -328,6 +405,7 @@ class PropertiesAPI(BaseClient):
             # Validate existing API format
             if not isinstance(property_data["fields"], list):
                 raise ValidationError("API format 'fields' must be a list")
+            self._validate_api_fields(property_data["fields"])
             return property_data.copy()
 
         # Convert simple format to API format
@@ -660,10 +738,9 @@ class PropertiesAPI(BaseClient):
             validated_id = self._validate_resource_id(property_id, "property")
 
             logger.info(f"Retrieving property with ID: {validated_id}")
-            response = self.get(f"/properties/{validated_id}")
-            result = self._process_response_data(
-                response, f"/properties/{validated_id}"
-            )
+            endpoint = f"/properties/{validated_id}"
+            response = self.get(endpoint)
+            result = self._process_response_data(response, endpoint)
 
             logger.info(f"Successfully retrieved property: {validated_id}")
             return result
@@ -712,10 +789,9 @@ class PropertiesAPI(BaseClient):
                 f"Updating property with ID: {validated_id}",
                 extra={"update_fields": list(property_data.keys())},
             )
-            response = self.put(f"/properties/{validated_id}", json_data=property_data)
-            result = self._process_response_data(
-                response, f"/properties/{validated_id}"
-            )
+            endpoint = f"/properties/{validated_id}"
+            response = self.put(endpoint, json_data=property_data)
+            result = self._process_response_data(response, endpoint)
 
             logger.info(f"Successfully updated property: {validated_id}")
             return result
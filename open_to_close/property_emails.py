@@ -3,6 +3,8 @@
 import logging
 from typing import Any, Dict, List, Optional
 
+import requests
+
 from .base_client import BaseClient
 from .exceptions import ValidationError
 
@@ -18,19 +20,23 @@ class PropertyEmailsAPI(BaseClient):
     """
 
     def __init__(
-        self, api_key: Optional[str] = None, base_url: Optional[str] = None
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        session: Optional[requests.Session] = None,
     ) -> None:
         """Initialize the property emails client.
 
         Args:
             api_key: API key for authentication
             base_url: Base URL for the API
+            session: Existing session to share with other clients
 
         Raises:
             AuthenticationError: If API key is missing or invalid
             ConfigurationError: If configuration is invalid
         """
-        super().__init__(api_key=api_key, base_url=base_url)
+        super().__init__(api_key=api_key, base_url=base_url, session=session)
         logger.debug("Initialized PropertyEmailsAPI client")
 
     def _validate_property_email_data(
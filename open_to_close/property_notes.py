@@ -1,10 +1,12 @@
 """Property notes client for Open To Close API."""
 
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Union
 
-from .base_client import BaseClient
-from .exceptions import ValidationError
+import requests
+
+from .base_client import BULK_MAX_WORKERS, DEFAULT_PAGE_SIZE, BaseClient
+from .exceptions import OpenToCloseAPIError, ValidationError
 
 logger = logging.getLogger(__name__)
 
@@ -18,19 +20,23 @@ class PropertyNotesAPI(BaseClient):
     """
 
     def __init__(
-        self, api_key: Optional[str] = None, base_url: Optional[str] = None
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        session: Optional[requests.Session] = None,
     ) -> None:
         """Initialize the property notes client.
 
         Args:
             api_key: API key for authentication
             base_url: Base URL for the API
+            session: Existing session to share with other clients
 
         Raises:
             AuthenticationError: If API key is missing or invalid
             ConfigurationError: If configuration is invalid
         """
-        super().__init__(api_key=api_key, base_url=base_url)
+        super().__init__(api_key=api_key, base_url=base_url, session=session)
         logger.debug("Initialized PropertyNotesAPI client")
 
     def _validate_property_note_data(
@@ -132,49 +138,7 @@ class PropertyNotesAPI(BaseClient):
         Raises:
             ValidationError: If parameters are invalid
         """
-        if params is None:
-            return {}
-
-        if not isinstance(params, dict):
-            raise ValidationError(
-                f"List parameters must be a dictionary, got {type(params).__name__}"
-            )
-
-        validated_params = params.copy()
-
-        # Validate limit parameter
-        if "limit" in validated_params:
-            limit = validated_params["limit"]
-            try:
-                limit_int = int(limit)
-                if limit_int <= 0:
-                    raise ValidationError(
-                        f"Limit must be a positive integer, got {limit_int}"
-                    )
-                if limit_int > 1000:  # Reasonable upper bound
-                    logger.warning(
-                        f"Large limit value: {limit_int}. Consider using pagination."
-                    )
-                validated_params["limit"] = limit_int
-            except (ValueError, TypeError):
-                raise ValidationError(
-                    f"Limit must be an integer, got {type(limit).__name__}: {limit}"
-                )
-
-        # Validate offset parameter
-        if "offset" in validated_params:
-            offset = validated_params["offset"]
-            try:
-                offset_int = int(offset)
-                if offset_int < 0:
-                    raise ValidationError(
-                        f"Offset must be non-negative, got {offset_int}"
-                    )
-                validated_params["offset"] = offset_int
-            except (ValueError, TypeError):
-                raise ValidationError(
-                    f"Offset must be an integer, got {type(offset).__name__}: {offset}"
-                )
+        validated_params = self._validate_pagination_params(params)
 
         # Validate author filter if provided
         if "author" in validated_params:
@@ -240,12 +204,9 @@ class PropertyNotesAPI(BaseClient):
                 f"Listing notes for property {validated_property_id}",
                 extra={"params": validated_params},
             )
-            response = self.get(
-                f"/properties/{validated_property_id}/notes", params=validated_params
-            )
-            result = self._process_list_response(
-                response, f"/properties/{validated_property_id}/notes"
-            )
+            endpoint = f"/properties/{validated_property_id}/notes"
+            response = self.get(endpoint, params=validated_params)
+            result = self._process_list_response(response, endpoint)
 
             logger.info(
                 f"Successfully retrieved {len(result)} notes for property {validated_property_id}"
@@ -259,6 +220,57 @@ class PropertyNotesAPI(BaseClient):
             )
             raise
 
+    def iter_property_notes(
+        self,
+        property_id: int,
+        params: Optional[Dict[str, Any]] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate over the notes for a specific property one page at a time.
+
+        Unlike ``list_property_notes``, only one page of notes is held in memory
+        and breaking out of the loop skips any remaining requests.
+
+        Args:
+            property_id: The ID of the property (must be a positive integer)
+            params: Optional dictionary of query parameters for filtering, as
+                   accepted by ``list_property_notes``. ``offset`` sets the
+                   starting position; ``limit`` is replaced by ``page_size``.
+            page_size: Number of notes to request per page
+
+        Returns:
+            An iterator of dictionaries, each representing a property note
+
+        Raises:
+            ValidationError: If property_id, parameters or page_size are invalid
+            NotFoundError: If the property is not found
+            AuthenticationError: If authentication fails
+            RateLimitError: If rate limit is exceeded
+            ServerError: If server error occurs
+            NetworkError: If network error occurs
+            OpenToCloseAPIError: For other API errors
+
+        Example:
+            ```python
+            for note in client.property_notes.iter_property_notes(
+                123, params={"author": "agent"}
+            ):
+                print(note.get("id"))
+            ```
+        """
+        validated_property_id = self._validate_resource_id(property_id, "property")
+        validated_params = self._validate_list_params(params)
+        validated_page_size = self._validate_pagination_params({"limit": page_size})[
+            "limit"
+        ]
+
+        logger.info(
+            f"Iterating notes for property {validated_property_id}",
+            extra={"params": validated_params, "page_size": validated_page_size},
+        )
+        endpoint = f"/properties/{validated_property_id}/notes"
+        return self._iter_list_pages(endpoint, validated_params, validated_page_size)
+
     def create_property_note(
         self, property_id: int, note_data: Dict[str, Any]
     ) -> Dict[str, Any]:
@@ -306,12 +318,9 @@ class PropertyNotesAPI(BaseClient):
                 f"Creating note for property {validated_property_id}",
                 extra={"content_length": len(note_data.get("content", ""))},
             )
-            response = self.post(
-                f"/properties/{validated_property_id}/notes", json_data=note_data
-            )
-            result = self._process_response_data(
-                response, f"/properties/{validated_property_id}/notes"
-            )
+            endpoint = f"/properties/{validated_property_id}/notes"
+            response = self.post(endpoint, json_data=note_data)
+            result = self._process_response_data(response, endpoint)
 
             logger.info(
                 f"Successfully created note for property {validated_property_id}"
@@ -363,13 +372,9 @@ class PropertyNotesAPI(BaseClient):
             logger.info(
                 f"Retrieving note {validated_note_id} for property {validated_property_id}"
             )
-            response = self.get(
-                f"/properties/{validated_property_id}/notes/{validated_note_id}"
-            )
-            result = self._process_response_data(
-                response,
-                f"/properties/{validated_property_id}/notes/{validated_note_id}",
-            )
+            endpoint = f"/properties/{validated_property_id}/notes/{validated_note_id}"
+            response = self.get(endpoint)
+            result = self._process_response_data(response, endpoint)
 
             logger.info(
                 f"Successfully retrieved note {validated_note_id} for property {validated_property_id}"
@@ -426,14 +431,9 @@ class PropertyNotesAPI(BaseClient):
                 f"Updating note {validated_note_id} for property {validated_property_id}",
                 extra={"update_fields": list(note_data.keys())},
             )
-            response = self.put(
-                f"/properties/{validated_property_id}/notes/{validated_note_id}",
-                json_data=note_data,
-            )
-            result = self._process_response_data(
-                response,
-                f"/properties/{validated_property_id}/notes/{validated_note_id}",
-            )
+            endpoint = f"/properties/{validated_property_id}/notes/{validated_note_id}"
+            response = self.put(endpoint, json_data=note_data)
+            result = self._process_response_data(response, endpoint)
 
             logger.info(
                 f"Successfully updated note {validated_note_id} for property {validated_property_id}"
@@ -485,9 +485,8 @@ class PropertyNotesAPI(BaseClient):
             logger.info(
                 f"Removing note {validated_note_id} from property {validated_property_id}"
             )
-            result = self.delete(
-                f"/properties/{validated_property_id}/notes/{validated_note_id}"
-            )
+            endpoint = f"/properties/{validated_property_id}/notes/{validated_note_id}"
+            result = self.delete(endpoint)
 
             logger.info(
                 f"Successfully removed note {validated_note_id} from property {validated_property_id}"
@@ -499,3 +498,35 @@ class PropertyNotesAPI(BaseClient):
                 f"Failed to remove note {note_id} from property {property_id}: {str(e)}"
             )
             raise
+
+    def delete_property_notes_bulk(
+        self,
+        property_id: int,
+        note_ids: List[int],
+        max_workers: int = BULK_MAX_WORKERS,
+    ) -> Dict[int, Union[Dict[str, Any], OpenToCloseAPIError]]:
+        """Remove several notes from a property concurrently, collecting the outcome per note.
+
+        Args:
+            property_id: The ID of the property (must be a positive integer)
+            note_ids: IDs of the notes to remove; duplicate IDs are removed once
+            max_workers: Maximum number of concurrent requests
+
+        Returns:
+            A dictionary mapping each note ID to the API response for its removal,
+            or to the exception raised when that removal failed
+
+        Raises:
+            ValidationError: If property_id, note_ids or max_workers is invalid
+
+        Example:
+            ```python
+            results = client.property_notes.delete_property_notes_bulk(123, [456, 457])
+            ```
+        """
+        validated_property_id = self._validate_resource_id(property_id, "property")
+
+        def delete_note(note_id: int) -> Dict[str, Any]:
+            return self.delete_property_note(validated_property_id, note_id)
+
+        return self._run_bulk(delete_note, note_ids, "note", max_workers)
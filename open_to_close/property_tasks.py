@@ -1,10 +1,12 @@
 """Property tasks client for Open To Close API."""
 
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Union
 
-from .base_client import BaseClient
-from .exceptions import ValidationError
+import requests
+
+from .base_client import BULK_MAX_WORKERS, DEFAULT_PAGE_SIZE, BaseClient
+from .exceptions import OpenToCloseAPIError, ValidationError
 
 logger = logging.getLogger(__name__)
 
@@ -18,19 +20,23 @@ class PropertyTasksAPI(BaseClient):
     """
 
     def __init__(
-        self, api_key: Optional[str] = None, base_url: Optional[str] = None
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        session: Optional[requests.Session] = None,
     ) -> None:
         """Initialize the property tasks client.
 
         Args:
             api_key: API key for authentication
             base_url: Base URL for the API
+            session: Existing session to share with other clients
 
         Raises:
             AuthenticationError: If API key is missing or invalid
             ConfigurationError: If configuration is invalid
         """
-        super().__init__(api_key=api_key, base_url=base_url)
+        super().__init__(api_key=api_key, base_url=base_url, session=session)
         logger.debug("Initialized PropertyTasksAPI client")
 
     def _validate_property_task_data(
@@ -146,49 +152,7 @@ class PropertyTasksAPI(BaseClient):
         Raises:
             ValidationError: If parameters are invalid
         """
-        if params is None:
-            return {}
-
-        if not isinstance(params, dict):
-            raise ValidationError(
-                f"List parameters must be a dictionary, got {type(params).__name__}"
-            )
-
-        validated_params = params.copy()
-
-        # Validate limit parameter
-        if "limit" in validated_params:
-            limit = validated_params["limit"]
-            try:
-                limit_int = int(limit)
-                if limit_int <= 0:
-                    raise ValidationError(
-                        f"Limit must be a positive integer, got {limit_int}"
-                    )
-                if limit_int > 1000:  # Reasonable upper bound
-                    logger.warning(
-                        f"Large limit value: {limit_int}. Consider using pagination."
-                    )
-                validated_params["limit"] = limit_int
-            except (ValueError, TypeError):
-                raise ValidationError(
-                    f"Limit must be an integer, got {type(limit).__name__}: {limit}"
-                )
-
-        # Validate offset parameter
-        if "offset" in validated_params:
-            offset = validated_params["offset"]
-            try:
-                offset_int = int(offset)
-                if offset_int < 0:
-                    raise ValidationError(
-                        f"Offset must be non-negative, got {offset_int}"
-                    )
-                validated_params["offset"] = offset_int
-            except (ValueError, TypeError):
-                raise ValidationError(
-                    f"Offset must be an integer, got {type(offset).__name__}: {offset}"
-                )
+        validated_params = self._validate_pagination_params(params)
 
         # Validate status filter if provided
         if "status" in validated_params:
@@ -254,12 +218,9 @@ class PropertyTasksAPI(BaseClient):
                 f"Listing tasks for property {validated_property_id}",
                 extra={"params": validated_params},
             )
-            response = self.get(
-                f"/properties/{validated_property_id}/tasks", params=validated_params
-            )
-            result = self._process_list_response(
-                response, f"/properties/{validated_property_id}/tasks"
-            )
+            endpoint = f"/properties/{validated_property_id}/tasks"
+            response = self.get(endpoint, params=validated_params)
+            result = self._process_list_response(response, endpoint)
 
             logger.info(
                 f"Successfully retrieved {len(result)} tasks for property {validated_property_id}"
@@ -273,6 +234,57 @@ class PropertyTasksAPI(BaseClient):
             )
             raise
 
+    def iter_property_tasks(
+        self,
+        property_id: int,
+        params: Optional[Dict[str, Any]] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate over the tasks for a specific property one page at a time.
+
+        Unlike ``list_property_tasks``, only one page of tasks is held in memory
+        and breaking out of the loop skips any remaining requests.
+
+        Args:
+            property_id: The ID of the property (must be a positive integer)
+            params: Optional dictionary of query parameters for filtering, as
+                   accepted by ``list_property_tasks``. ``offset`` sets the
+                   starting position; ``limit`` is replaced by ``page_size``.
+            page_size: Number of tasks to request per page
+
+        Returns:
+            An iterator of dictionaries, each representing a property task
+
+        Raises:
+            ValidationError: If property_id, parameters or page_size are invalid
+            NotFoundError: If the property is not found
+            AuthenticationError: If authentication fails
+            RateLimitError: If rate limit is exceeded
+            ServerError: If server error occurs
+            NetworkError: If network error occurs
+            OpenToCloseAPIError: For other API errors
+
+        Example:
+            ```python
+            for task in client.property_tasks.iter_property_tasks(
+                123, params={"status": "pending"}
+            ):
+                print(task.get("id"))
+            ```
+        """
+        validated_property_id = self._validate_resource_id(property_id, "property")
+        validated_params = self._validate_list_params(params)
+        validated_page_size = self._validate_pagination_params({"limit": page_size})[
+            "limit"
+        ]
+
+        logger.info(
+            f"Iterating tasks for property {validated_property_id}",
+            extra={"params": validated_params, "page_size": validated_page_size},
+        )
+        endpoint = f"/properties/{validated_property_id}/tasks"
+        return self._iter_list_pages(endpoint, validated_params, validated_page_size)
+
     def create_property_task(
         self, property_id: int, task_data: Dict[str, Any]
     ) -> Dict[str, Any]:
@@ -321,12 +333,9 @@ class PropertyTasksAPI(BaseClient):
                 f"Creating task for property {validated_property_id}",
                 extra={"title": task_data.get("title", "unknown")},
             )
-            response = self.post(
-                f"/properties/{validated_property_id}/tasks", json_data=task_data
-            )
-            result = self._process_response_data(
-                response, f"/properties/{validated_property_id}/tasks"
-            )
+            endpoint = f"/properties/{validated_property_id}/tasks"
+            response = self.post(endpoint, json_data=task_data)
+            result = self._process_response_data(response, endpoint)
 
             logger.info(
                 f"Successfully created task for property {validated_property_id}"
@@ -378,13 +387,9 @@ class PropertyTasksAPI(BaseClient):
             logger.info(
                 f"Retrieving task {validated_task_id} for property {validated_property_id}"
             )
-            response = self.get(
-                f"/properties/{validated_property_id}/tasks/{validated_task_id}"
-            )
-            result = self._process_response_data(
-                response,
-                f"/properties/{validated_property_id}/tasks/{validated_task_id}",
-            )
+            endpoint = f"/properties/{validated_property_id}/tasks/{validated_task_id}"
+            response = self.get(endpoint)
+            result = self._process_response_data(response, endpoint)
 
             logger.info(
                 f"Successfully retrieved task {validated_task_id} for property {validated_property_id}"
@@ -442,14 +447,9 @@ class PropertyTasksAPI(BaseClient):
                 f"Updating task {validated_task_id} for property {validated_property_id}",
                 extra={"update_fields": list(task_data.keys())},
             )
-            response = self.put(
-                f"/properties/{validated_property_id}/tasks/{validated_task_id}",
-                json_data=task_data,
-            )
-            result = self._process_response_data(
-                response,
-                f"/properties/{validated_property_id}/tasks/{validated_task_id}",
-            )
+            endpoint = f"/properties/{validated_property_id}/tasks/{validated_task_id}"
+            response = self.put(endpoint, json_data=task_data)
+            result = self._process_response_data(response, endpoint)
 
             logger.info(
                 f"Successfully updated task {validated_task_id} for property {validated_property_id}"
@@ -501,9 +501,8 @@ class PropertyTasksAPI(BaseClient):
             logger.info(
                 f"Removing task {validated_task_id} from property {validated_property_id}"
             )
-            result = self.delete(
-                f"/properties/{validated_property_id}/tasks/{validated_task_id}"
-            )
+            endpoint = f"/properties/{validated_property_id}/tasks/{validated_task_id}"
+            result = self.delete(endpoint)
 
             logger.info(
                 f"Successfully removed task {validated_task_id} from property {validated_property_id}"
@@ -515,3 +514,35 @@ class PropertyTasksAPI(BaseClient):
                 f"Failed to remove task {task_id} from property {property_id}: {str(e)}"
             )
             raise
+
+    def delete_property_tasks_bulk(
+        self,
+        property_id: int,
+        task_ids: List[int],
+        max_workers: int = BULK_MAX_WORKERS,
+    ) -> Dict[int, Union[Dict[str, Any], OpenToCloseAPIError]]:
+        """Remove several tasks from a property concurrently, collecting the outcome per task.
+
+        Args:
+            property_id: The ID of the property (must be a positive integer)
+            task_ids: IDs of the tasks to remove; duplicate IDs are removed once
+            max_workers: Maximum number of concurrent requests
+
+        Returns:
+            A dictionary mapping each task ID to the API response for its removal,
+            or to the exception raised when that removal failed
+
+        Raises:
+            ValidationError: If property_id, task_ids or max_workers is invalid
+
+        Example:
+            ```python
+            results = client.property_tasks.delete_property_tasks_bulk(123, [456, 457])
+            ```
+        """
+        validated_property_id = self._validate_resource_id(property_id, "property")
+
+        def delete_task(task_id: int) -> Dict[str, Any]:
+            return self.delete_property_task(validated_property_id, task_id)
+
+        return self._run_bulk(delete_task, task_ids, "task", max_workers)
@@ -1,10 +1,12 @@
 """Tags client for Open To Close API."""
 
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
-from .base_client import BaseClient
-from .exceptions import ValidationError
+import requests
+
+from .base_client import BULK_MAX_WORKERS, BaseClient
+from .exceptions import OpenToCloseAPIError, ValidationError
 
 logger = logging.getLogger(__name__)
 
@@ -17,19 +19,23 @@ class TagsAPI(BaseClient):
     """
 
     def __init__(
-        self, api_key: Optional[str] = None, base_url: Optional[str] = None
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        session: Optional[requests.Session] = None,
     ) -> None:
         """Initialize the tags client.
 
         Args:
             api_key: API key for authentication
             base_url: Base URL for the API
+            session: Existing session to share with other clients
 
         Raises:
             AuthenticationError: If API key is missing or invalid
             ConfigurationError: If configuration is invalid
         """
-        super().__init__(api_key=api_key, base_url=base_url)
+        super().__init__(api_key=api_key, base_url=base_url, session=session)
         logger.debug("Initialized TagsAPI client")
 
     def _validate_tag_data(self, tag_data: Dict[str, Any], operation: str) -> None:
@@ -130,49 +136,7 @@ class TagsAPI(BaseClient):
         Raises:
             ValidationError: If parameters are invalid
         """
-        if params is None:
-            return {}
-
-        if not isinstance(params, dict):
-            raise ValidationError(
-                f"List parameters must be a dictionary, got {type(params).__name__}"
-            )
-
-        validated_params = params.copy()
-
-        # Validate limit parameter
-        if "limit" in validated_params:
-            limit = validated_params["limit"]
-            try:
-                limit_int = int(limit)
-                if limit_int <= 0:
-                    raise ValidationError(
-                        f"Limit must be a positive integer, got {limit_int}"
-                    )
-                if limit_int > 1000:  # Reasonable upper bound
-                    logger.warning(
-                        f"Large limit value: {limit_int}. Consider using pagination."
-                    )
-                validated_params["limit"] = limit_int
-            except (ValueError, TypeError):
-                raise ValidationError(
-                    f"Limit must be an integer, got {type(limit).__name__}: {limit}"
-                )
-
-        # Validate offset parameter
-        if "offset" in validated_params:
-            offset = validated_params["offset"]
-            try:
-                offset_int = int(offset)
-                if offset_int < 0:
-                    raise ValidationError(
-                        f"Offset must be non-negative, got {offset_int}"
-                    )
-                validated_params["offset"] = offset_int
-            except (ValueError, TypeError):
-                raise ValidationError(
-                    f"Offset must be an integer, got {type(offset).__name__}: {offset}"
-                )
+        validated_params = self._validate_pagination_params(params)
 
         # Validate category filter if provided
         if "category" in validated_params:
@@ -329,8 +293,9 @@ class TagsAPI(BaseClient):
             validated_id = self._validate_resource_id(tag_id, "tag")
 
             logger.info(f"Retrieving tag with ID: {validated_id}")
-            response = self.get(f"/tags/{validated_id}")
-            result = self._process_response_data(response, f"/tags/{validated_id}")
+            endpoint = f"/tags/{validated_id}"
+            response = self.get(endpoint)
+            result = self._process_response_data(response, endpoint)
 
             logger.info(f"Successfully retrieved tag: {validated_id}")
             return result
@@ -377,8 +342,9 @@ class TagsAPI(BaseClient):
                 f"Updating tag with ID: {validated_id}",
                 extra={"update_fields": list(tag_data.keys())},
             )
-            response = self.put(f"/tags/{validated_id}", json_data=tag_data)
-            result = self._process_response_data(response, f"/tags/{validated_id}")
+            endpoint = f"/tags/{validated_id}"
+            response = self.put(endpoint, json_data=tag_data)
+            result = self._process_response_data(response, endpoint)
 
             logger.info(f"Successfully updated tag: {validated_id}")
             return result
@@ -432,3 +398,31 @@ class TagsAPI(BaseClient):
         except Exception as e:
             logger.error(f"Failed to delete tag {tag_id}: {str(e)}")
             raise
+
+    def delete_tags_bulk(
+        self, tag_ids: List[int], max_workers: int = BULK_MAX_WORKERS
+    ) -> Dict[int, Union[Dict[str, Any], OpenToCloseAPIError]]:
+        """Delete several tags concurrently, collecting the outcome per tag.
+
+        Args:
+            tag_ids: IDs of the tags to delete; duplicate IDs are deleted once
+            max_workers: Maximum number of concurrent requests
+
+        Returns:
+            A dictionary mapping each tag ID to the API response for its deletion,
+            or to the exception raised when that deletion failed
+
+        Raises:
+            ValidationError: If tag_ids is not a list or max_workers is invalid
+
+        Example:
+            ```python
+            results = client.tags.delete_tags_bulk([123, 124, 125])
+            failed = {
+                tag_id: error
+                for tag_id, error in results.items()
+                if isinstance(error, Exception)
+            }
+            ```
+        """
+        return self._run_bulk(self.delete_tag, tag_ids, "tag", max_workers)
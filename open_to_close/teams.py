@@ -1,9 +1,12 @@
 """Teams client for Open To Close API."""
 
+import copy
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
-from .base_client import BaseClient
+import requests
+
+from .base_client import DEFAULT_PAGE_CONCURRENCY, DEFAULT_PAGE_SIZE, BaseClient
 from .exceptions import ValidationError
 
 logger = logging.getLogger(__name__)
@@ -17,19 +20,27 @@ class TeamsAPI(BaseClient):
     """
 
     def __init__(
-        self, api_key: Optional[str] = None, base_url: Optional[str] = None
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        session: Optional[requests.Session] = None,
+        cache_ttl: Optional[float] = None,
     ) -> None:
         """Initialize the teams client.
 
         Args:
             api_key: API key for authentication
             base_url: Base URL for the API
+            session: Existing session to share with other clients
+            cache_ttl: Seconds to reuse a team fetched by ``retrieve_team``
+                before requesting it again. Caching is disabled when None.
 
         Raises:
             AuthenticationError: If API key is missing or invalid
             ConfigurationError: If configuration is invalid
         """
-        super().__init__(api_key=api_key, base_url=base_url)
+        super().__init__(api_key=api_key, base_url=base_url, session=session)
+        self._cache = self._create_response_cache(cache_ttl)
         logger.debug("Initialized TeamsAPI client")
 
     def _validate_team_data(self, team_data: Dict[str, Any], operation: str) -> None:
@@ -121,49 +132,7 @@ class TeamsAPI(BaseClient):
         Raises:
             ValidationError: If parameters are invalid
         """
-        if params is None:
-            return {}
-
-        if not isinstance(params, dict):
-            raise ValidationError(
-                f"List parameters must be a dictionary, got {type(params).__name__}"
-            )
-
-        validated_params = params.copy()
-
-        # Validate limit parameter
-        if "limit" in validated_params:
-            limit = validated_params["limit"]
-            try:
-                limit_int = int(limit)
-                if limit_int <= 0:
-                    raise ValidationError(
-                        f"Limit must be a positive integer, got {limit_int}"
-                    )
-                if limit_int > 1000:  # Reasonable upper bound
-                    logger.warning(
-                        f"Large limit value: {limit_int}. Consider using pagination."
-                    )
-                validated_params["limit"] = limit_int
-            except (ValueError, TypeError):
-                raise ValidationError(
-                    f"Limit must be an integer, got {type(limit).__name__}: {limit}"
-                )
-
-        # Validate offset parameter
-        if "offset" in validated_params:
-            offset = validated_params["offset"]
-            try:
-                offset_int = int(offset)
-                if offset_int < 0:
-                    raise ValidationError(
-                        f"Offset must be non-negative, got {offset_int}"
-                    )
-                validated_params["offset"] = offset_int
-            except (ValueError, TypeError):
-                raise ValidationError(
-                    f"Offset must be an integer, got {type(offset).__name__}: {offset}"
-                )
+        validated_params = self._validate_pagination_params(params)
 
         logger.debug("List parameters validated", extra={"params": validated_params})
         return validated_params
@@ -214,6 +183,67 @@ class TeamsAPI(BaseClient):
             logger.error(f"Failed to list teams: {str(e)}", extra={"params": params})
             raise
 
+    def iter_teams(
+        self,
+        params: Optional[Dict[str, Any]] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        concurrency: int = DEFAULT_PAGE_CONCURRENCY,
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate over all teams, optionally fetching pages concurrently.
+
+        Pages are requested one at a time by default. With ``concurrency``
+        above one, the first page is requested on its own; when it is full,
+        following pages are requested ``concurrency`` at a time over the shared
+        session. Teams are yielded in page order. A batch can request up to
+        ``concurrency - 1`` empty pages past the end of the list, and each of
+        those requests counts against the rate limit.
+
+        Args:
+            params: Optional dictionary of query parameters for filtering, as
+                   accepted by ``list_teams``. ``offset`` sets the starting
+                   position; ``limit`` is replaced by ``page_size``.
+            page_size: Number of teams to request per page
+            concurrency: Maximum number of pages requested at once. Defaults
+                to 1, so pages are fetched one after another.
+
+        Returns:
+            An iterator of dictionaries, each representing a team
+
+        Raises:
+            ValidationError: If parameters, page_size or concurrency are invalid
+            AuthenticationError: If authentication fails
+            RateLimitError: If rate limit is exceeded
+            ServerError: If server error occurs
+            NetworkError: If network error occurs
+            OpenToCloseAPIError: For other API errors
+
+        Example:
+            ```python
+            for team in client.teams.iter_teams(params={"status": "active"}):
+                print(team.get("id"))
+            ```
+        """
+        validated_params = self._validate_list_params(params)
+        validated_page_size = self._validate_pagination_params({"limit": page_size})[
+            "limit"
+        ]
+        validated_concurrency = self._validate_worker_count(concurrency, "concurrency")
+
+        logger.info(
+            "Iterating teams",
+            extra={
+                "params": validated_params,
+                "page_size": validated_page_size,
+                "concurrency": validated_concurrency,
+            },
+        )
+        return self._iter_list_pages(
+            "/teams",
+            validated_params,
+            validated_page_size,
+            validated_concurrency,
+        )
+
     def create_team(self, team_data: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new team with comprehensive validation.
 
@@ -300,9 +330,19 @@ class TeamsAPI(BaseClient):
         try:
             validated_id = self._validate_resource_id(team_id, "team")
 
+            if self._cache is not None:
+                cached = self._cache.get(validated_id)
+                if cached is not None:
+                    logger.debug(f"Returning cached team: {validated_id}")
+                    return copy.deepcopy(cached)
+
             logger.info(f"Retrieving team with ID: {validated_id}")
-            response = self.get(f"/teams/{validated_id}")
-            result = self._process_response_data(response, f"/teams/{validated_id}")
+            endpoint = f"/teams/{validated_id}"
+            response = self.get(endpoint)
+            result = self._process_response_data(response, endpoint)
+
+            if self._cache is not None:
+                self._cache.set(validated_id, copy.deepcopy(result))
 
             logger.info(f"Successfully retrieved team: {validated_id}")
             return result
@@ -349,8 +389,11 @@ class TeamsAPI(BaseClient):
                 f"Updating team with ID: {validated_id}",
                 extra={"update_fields": list(team_data.keys())},
             )
-            response = self.put(f"/teams/{validated_id}", json_data=team_data)
-            result = self._process_response_data(response, f"/teams/{validated_id}")
+            if self._cache is not None:
+                self._cache.pop(validated_id)
+            endpoint = f"/teams/{validated_id}"
+            response = self.put(endpoint, json_data=team_data)
+            result = self._process_response_data(response, endpoint)
 
             logger.info(f"Successfully updated team: {validated_id}")
             return result
@@ -396,6 +439,8 @@ class TeamsAPI(BaseClient):
             validated_id = self._validate_resource_id(team_id, "team")
 
             logger.info(f"Deleting team with ID: {validated_id}")
+            if self._cache is not None:
+                self._cache.pop(validated_id)
             result = self.delete(f"/teams/{validated_id}")
 
             logger.info(f"Successfully deleted team: {validated_id}")
@@ -1,10 +1,18 @@
 """Users client for Open To Close API."""
 
+import copy
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Union
 
-from .base_client import BaseClient
-from .exceptions import ValidationError
+import requests
+
+from .base_client import (
+    BULK_MAX_WORKERS,
+    DEFAULT_PAGE_CONCURRENCY,
+    DEFAULT_PAGE_SIZE,
+    BaseClient,
+)
+from .exceptions import OpenToCloseAPIError, ValidationError
 
 logger = logging.getLogger(__name__)
 
@@ -17,19 +25,27 @@ class UsersAPI(BaseClient):
     """
 
     def __init__(
-        self, api_key: Optional[str] = None, base_url: Optional[str] = None
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        session: Optional[requests.Session] = None,
+        cache_ttl: Optional[float] = None,
     ) -> None:
         """Initialize the users client.
 
         Args:
             api_key: API key for authentication
             base_url: Base URL for the API
+            session: Existing session to share with other clients
+            cache_ttl: Seconds to reuse a user fetched by ``retrieve_user``
+                before requesting it again. Caching is disabled when None.
 
         Raises:
             AuthenticationError: If API key is missing or invalid
             ConfigurationError: If configuration is invalid
         """
-        super().__init__(api_key=api_key, base_url=base_url)
+        super().__init__(api_key=api_key, base_url=base_url, session=session)
+        self._cache = self._create_response_cache(cache_ttl)
         logger.debug("Initialized UsersAPI client")
 
     def _validate_user_data(self, user_data: Dict[str, Any], operation: str) -> None:
@@ -110,49 +126,7 @@ class UsersAPI(BaseClient):
         Raises:
             ValidationError: If parameters are invalid
         """
-        if params is None:
-            return {}
-
-        if not isinstance(params, dict):
-            raise ValidationError(
-                f"List parameters must be a dictionary, got {type(params).__name__}"
-            )
-
-        validated_params = params.copy()
-
-        # Validate limit parameter
-        if "limit" in validated_params:
-            limit = validated_params["limit"]
-            try:
-                limit_int = int(limit)
-                if limit_int <= 0:
-                    raise ValidationError(
-                        f"Limit must be a positive integer, got {limit_int}"
-                    )
-                if limit_int > 1000:  # Reasonable upper bound
-                    logger.warning(
-                        f"Large limit value: {limit_int}. Consider using pagination."
-                    )
-                validated_params["limit"] = limit_int
-            except (ValueError, TypeError):
-                raise ValidationError(
-                    f"Limit must be an integer, got {type(limit).__name__}: {limit}"
-                )
-
-        # Validate offset parameter
-        if "offset" in validated_params:
-            offset = validated_params["offset"]
-            try:
-                offset_int = int(offset)
-                if offset_int < 0:
-                    raise ValidationError(
-                        f"Offset must be non-negative, got {offset_int}"
-                    )
-                validated_params["offset"] = offset_int
-            except (ValueError, TypeError):
-                raise ValidationError(
-                    f"Offset must be an integer, got {type(offset).__name__}: {offset}"
-                )
+        validated_params = self._validate_pagination_params(params)
 
         logger.debug("List parameters validated", extra={"params": validated_params})
         return validated_params
@@ -204,6 +178,67 @@ class UsersAPI(BaseClient):
             logger.error(f"Failed to list users: {str(e)}", extra={"params": params})
             raise
 
+    def iter_users(
+        self,
+        params: Optional[Dict[str, Any]] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        concurrency: int = DEFAULT_PAGE_CONCURRENCY,
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate over all users, optionally fetching pages concurrently.
+
+        Pages are requested one at a time by default. With ``concurrency``
+        above one, the first page is requested on its own; when it is full,
+        following pages are requested ``concurrency`` at a time over the shared
+        session. Users are yielded in page order. A batch can request up to
+        ``concurrency - 1`` empty pages past the end of the list, and each of
+        those requests counts against the rate limit.
+
+        Args:
+            params: Optional dictionary of query parameters for filtering, as
+                   accepted by ``list_users``. ``offset`` sets the starting
+                   position; ``limit`` is replaced by ``page_size``.
+            page_size: Number of users to request per page
+            concurrency: Maximum number of pages requested at once. Defaults
+                to 1, so pages are fetched one after another.
+
+        Returns:
+            An iterator of dictionaries, each representing a user
+
+        Raises:
+            ValidationError: If parameters, page_size or concurrency are invalid
+            AuthenticationError: If authentication fails
+            RateLimitError: If rate limit is exceeded
+            ServerError: If server error occurs
+            NetworkError: If network error occurs
+            OpenToCloseAPIError: For other API errors
+
+        Example:
+            ```python
+            for user in client.users.iter_users(params={"status": "active"}):
+                print(user.get("id"))
+            ```
+        """
+        validated_params = self._validate_list_params(params)
+        validated_page_size = self._validate_pagination_params({"limit": page_size})[
+            "limit"
+        ]
+        validated_concurrency = self._validate_worker_count(concurrency, "concurrency")
+
+        logger.info(
+            "Iterating users",
+            extra={
+                "params": validated_params,
+                "page_size": validated_page_size,
+                "concurrency": validated_concurrency,
+            },
+        )
+        return self._iter_list_pages(
+            "/users",
+            validated_params,
+            validated_page_size,
+            validated_concurrency,
+        )
+
     def create_user(self, user_data: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new user with comprehensive validation.
 
@@ -293,9 +328,19 @@ class UsersAPI(BaseClient):
         try:
             validated_id = self._validate_resource_id(user_id, "user")
 
+            if self._cache is not None:
+                cached = self._cache.get(validated_id)
+                if cached is not None:
+                    logger.debug(f"Returning cached user: {validated_id}")
+                    return copy.deepcopy(cached)
+
             logger.info(f"Retrieving user with ID: {validated_id}")
-            response = self.get(f"/users/{validated_id}")
-            result = self._process_response_data(response, f"/users/{validated_id}")
+            endpoint = f"/users/{validated_id}"
+            response = self.get(endpoint)
+            result = self._process_response_data(response, endpoint)
+
+            if self._cache is not None:
+                self._cache.set(validated_id, copy.deepcopy(result))
 
             logger.info(f"Successfully retrieved user: {validated_id}")
             return result
@@ -304,6 +349,37 @@ class UsersAPI(BaseClient):
             logger.error(f"Failed to retrieve user {user_id}: {str(e)}")
             raise
 
+    def retrieve_users_bulk(
+        self, user_ids: List[int], max_workers: int = BULK_MAX_WORKERS
+    ) -> Dict[int, Union[Dict[str, Any], OpenToCloseAPIError]]:
+        """Retrieve several users concurrently, collecting the outcome per user.
+
+        Requests share the client's pooled session, and users already in the
+        ``retrieve_user`` cache are returned without a request.
+
+        Args:
+            user_ids: IDs of the users to retrieve; duplicate IDs are fetched once
+            max_workers: Maximum number of concurrent requests
+
+        Returns:
+            A dictionary mapping each user ID to the retrieved user, or to the
+            exception raised when that retrieval failed
+
+        Raises:
+            ValidationError: If user_ids is not a list or max_workers is invalid
+
+        Example:
+            ```python
+            users = client.users.retrieve_users_bulk([123, 124, 125])
+            emails = {
+                user_id: user.get("email")
+                for user_id, user in users.items()
+                if not isinstance(user, Exception)
+            }
+            ```
+        """
+        return self._run_bulk(self.retrieve_user, user_ids, "user", max_workers)
+
     def update_user(self, user_id: int, user_data: Dict[str, Any]) -> Dict[str, Any]:
         """Update an existing user with validation.
 
@@ -342,8 +418,11 @@ class UsersAPI(BaseClient):
                 f"Updating user with ID: {validated_id}",
                 extra={"update_fields": list(user_data.keys())},
             )
-            response = self.put(f"/users/{validated_id}", json_data=user_data)
-            result = self._process_response_data(response, f"/users/{validated_id}")
+            if self._cache is not None:
+                self._cache.pop(validated_id)
+            endpoint = f"/users/{validated_id}"
+            response = self.put(endpoint, json_data=user_data)
+            result = self._process_response_data(response, endpoint)
 
             logger.info(f"Successfully updated user: {validated_id}")
             return result
@@ -389,6 +468,8 @@ class UsersAPI(BaseClient):
             validated_id = self._validate_resource_id(user_id, "user")
 
             logger.info(f"Deleting user with ID: {validated_id}")
+            if self._cache is not None:
+                self._cache.pop(validated_id)
             result = self.delete(f"/users/{validated_id}")
 
             logger.info(f"Successfully deleted user: {validated_id}")
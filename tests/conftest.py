@@ -0,0 +1,38 @@
+"""Shared pytest fixtures."""
+
+import importlib
+from typing import Iterator
+from unittest.mock import Mock
+
+import pytest
+import requests
+
+from open_to_close import OpenToCloseAPI, _json
+
+
+@pytest.fixture(scope="session")
+def client() -> OpenToCloseAPI:
+    """Create a test client shared by every test.
+
+    Tests patch ``Session.request`` or intercept requests at the adapter, and
+    the default client has neither a response cache nor an ETag cache, so
+    nothing carries over between tests. Tests that need a fresh or differently
+    configured client build their own.
+    """
+    return OpenToCloseAPI(api_key="test_key")
+
+
+@pytest.fixture
+def mock_session_request(monkeypatch: pytest.MonkeyPatch) -> Mock:
+    """Replace ``requests.Session.request`` so tests never reach the network."""
+    session_request = Mock()
+    monkeypatch.setattr(requests.Session, "request", session_request)
+    return session_request
+
+
+@pytest.fixture
+def reload_json(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    """Restore the configured JSON backend after a test reloads the module."""
+    yield
+    monkeypatch.undo()
+    importlib.reload(_json)
@@ -0,0 +1,22 @@
+"""Helpers shared by the test modules."""
+
+import json
+from types import SimpleNamespace
+from typing import Any
+
+
+def make_response(payload: Any, status_code: int = 200) -> SimpleNamespace:
+    """Create a response stub whose ``json()`` returns ``payload``.
+
+    Only the attributes the client reads are provided: ``status_code``,
+    ``headers``, ``content``, ``text``, ``json()`` and ``close()``.
+    """
+    text = json.dumps(payload)
+    return SimpleNamespace(
+        status_code=status_code,
+        headers={},
+        content=text.encode("utf-8"),
+        text=text,
+        json=lambda: payload,
+        close=lambda: None,
+    )
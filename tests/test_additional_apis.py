@@ -1,1262 +1,591 @@
-"""Tests for additional API endpoints with low coverage."""
+"""Tests for additional API endpoints with low coverage.
 
-from unittest.mock import Mock, patch
+Read-only response stubs are module constants rather than fixtures, so tests
+assign them directly; only the shared client and the patched
+``Session.request`` go through pytest fixtures.
+"""
+
+from types import SimpleNamespace
+from typing import Any, Dict, Iterator, List, Tuple
+from unittest.mock import Mock
 
 import pytest
-import requests
 
 from open_to_close import OpenToCloseAPI
-from open_to_close.exceptions import DataFormatError
-
-
-@pytest.fixture
-def client() -> OpenToCloseAPI:
-    """Create a test client."""
-    return OpenToCloseAPI(api_key="test_key")
-
-
-@pytest.fixture
-def mock_response() -> Mock:
-    """Create a mock response."""
-    response = Mock(spec=requests.Response)
-    response.status_code = 200
-    response.json.return_value = {"id": 1, "name": "Test"}
-    response.headers = {}
-    return response
-
-
-@pytest.fixture
-def mock_list_response() -> Mock:
-    """Create a mock list response."""
-    response = Mock(spec=requests.Response)
-    response.status_code = 200
-    response.json.return_value = [{"id": 1, "name": "Test Item"}]
-    response.headers = {}
-    return response
-
-
-@pytest.fixture
-def mock_delete_response() -> Mock:
-    """Create a mock delete response."""
-    response = Mock(spec=requests.Response)
-    response.status_code = 204
-    response.json.return_value = {}
-    response.headers = {}
-    return response
-
-
-class TestTagsAPI:
-    """Test TagsAPI functionality."""
-
-    def test_tags_initialization(self, client: OpenToCloseAPI) -> None:
-        """Test that tags API can be initialized."""
-        tags = client.tags
-        assert tags is not None
-        assert hasattr(tags, "list_tags")
-        assert hasattr(tags, "create_tag")
-        assert hasattr(tags, "retrieve_tag")
-        assert hasattr(tags, "update_tag")
-        assert hasattr(tags, "delete_tag")
-
-    @patch("open_to_close.base_client.requests.Session.request")
-    def test_list_tags(
-        self, mock_request: Mock, client: OpenToCloseAPI, mock_list_response: Mock
-    ) -> None:
-        """Test listing tags."""
-        mock_request.return_value = mock_list_response
-
-        tags = client.tags.list_tags()
-
-        assert isinstance(tags, list)
-        assert len(tags) == 1
-        assert tags[0]["id"] == 1
-        mock_request.assert_called_once()
-
-    @patch("open_to_close.base_client.requests.Session.request")
-    def test_list_tags_with_params(
-        self, mock_request: Mock, client: OpenToCloseAPI, mock_list_response: Mock
-    ) -> None:
-        """Test listing tags with parameters."""
-        mock_request.return_value = mock_list_response
-
-        tags = client.tags.list_tags(params={"limit": 50})
-
-        assert isinstance(tags, list)
-        mock_request.assert_called_once()
-
-    @patch("open_to_close.base_client.requests.Session.request")
-    def test_list_tags_dict_response(
-        self, mock_request: Mock, client: OpenToCloseAPI
-    ) -> None:
-        """Test listing tags with dict response containing data."""
-        response = Mock(spec=requests.Response)
-        response.status_code = 200
-        response.json.return_value = {"data": [{"id": 1, "name": "Test Tag"}]}
-        response.headers = {}
-        mock_request.return_value = response
-
-        tags = client.tags.list_tags()
-
-        assert isinstance(tags, list)
-        assert len(tags) == 1
-        mock_request.assert_called_once()
-
-    @patch("open_to_close.base_client.requests.Session.request")
-    def test_create_tag(
-        self, mock_request: Mock, client: OpenToCloseAPI, mock_response: Mock
-    ) -> None:
-        """Test creating a tag."""
-        mock_request.return_value = mock_response
-        mock_response.json.return_value = {
-            "id": 1,
-            "name": "VIP Client",
-            "color": "#ff0000",
+from open_to_close.exceptions import (
+    DataFormatError,
+    OpenToCloseAPIError,
+    ValidationError,
+)
+
+from .helpers import make_response
+
+# Response shapes shared by tests that only read them
+RESP_LIST = make_response([{"id": 1, "name": "Test Item"}])
+RESP_NO_CONTENT = make_response({}, status_code=204)
+RESP_DATA_LIST = make_response({"data": [{"id": 1, "name": "Test Item"}]})
+RESP_DATA_DICT = make_response({"data": {"id": 1, "name": "Test Item"}})
+RESP_DATA_NOT_LIST = make_response({"data": "not a list"})
+RESP_DATA_NOT_DICT = make_response({"data": "not a dict"})
+RESP_UNEXPECTED = make_response("unexpected string response")
+
+
+@pytest.fixture(autouse=True)
+def mock_request(
+    mock_session_request: Mock, request: pytest.FixtureRequest
+) -> Iterator[Mock]:
+    """Patch Session.request for every test so nothing reaches the network.
+
+    Each test must send exactly one request unless it is marked with
+    ``expected_calls(n)``; the count is checked on teardown.
+    """
+    marker = request.node.get_closest_marker("expected_calls")
+    expected_calls = marker.args[0] if marker else 1
+
+    yield mock_session_request
+
+    call_count = mock_session_request.call_count
+    assert (
+        call_count == expected_calls
+    ), f"expected {expected_calls} request(s), got {call_count}"
+
+
+# (client attribute, resource noun, parent IDs, create data, update data); the
+# payload dicts are shared by every parametrized test and must not be mutated
+RESOURCES = (
+    ("tags", "tag", (), {"name": "Test Tag"}, {"name": "Updated Tag"}),
+    ("teams", "team", (), {"name": "Test Team"}, {"name": "Updated Team"}),
+    (
+        "users",
+        "user",
+        (),
+        {"name": "Test User", "email": "test@example.com", "role": "agent"},
+        {"name": "Updated User", "role": "admin"},
+    ),
+    (
+        "property_emails",
+        "property_email",
+        (1,),
+        {"subject": "Test Email"},
+        {"subject": "Updated Email"},
+    ),
+    (
+        "property_notes",
+        "property_note",
+        (1,),
+        {"title": "Test Note", "content": "This is test note content"},
+        {"title": "Updated Note"},
+    ),
+    (
+        "property_documents",
+        "property_document",
+        (1,),
+        {"title": "Test Document", "name": "test-document.pdf"},
+        {"title": "Updated Document"},
+    ),
+    (
+        "property_tasks",
+        "property_task",
+        (1,),
+        {"title": "Test Task"},
+        {"title": "Updated Task", "status": "completed"},
+    ),
+)
+
+crud_resources = pytest.mark.parametrize(
+    "attr,noun,parent_ids,create_data,update_data",
+    RESOURCES,
+    ids=[resource[0] for resource in RESOURCES],
+)
+
+
+def _crud_method(client: OpenToCloseAPI, attr: str, action: str, noun: str) -> Any:
+    """Look up a CRUD method such as ``client.tags.create_tag``."""
+    name = f"list_{attr}" if action == "list" else f"{action}_{noun}"
+    return getattr(getattr(client, attr), name)
+
+
+@crud_resources
+class TestCrudResources:
+    """Test the list/create/retrieve/update/delete methods shared by resources."""
+
+    @pytest.mark.expected_calls(0)
+    def test_interface(
+        self,
+        client: OpenToCloseAPI,
+        attr: str,
+        noun: str,
+        parent_ids: Tuple[int, ...],
+        create_data: Dict[str, Any],
+        update_data: Dict[str, Any],
+    ) -> None:
+        """Test that the resource client exposes every CRUD method."""
+        expected = {f"list_{attr}"} | {
+            f"{action}_{noun}" for action in ("create", "retrieve", "update", "delete")
         }
 
-        tag_data = {"name": "VIP Client", "color": "#ff0000"}
-        tag = client.tags.create_tag(tag_data)
-
-        assert isinstance(tag, dict)
-        assert tag.get("id") == 1
-        assert tag.get("name") == "VIP Client"
-        mock_request.assert_called_once()
-
-    @patch("open_to_close.base_client.requests.Session.request")
-    def test_create_tag_dict_response(
-        self, mock_request: Mock, client: OpenToCloseAPI
-    ) -> None:
-        """Test creating a tag with dict response containing data."""
-        response = Mock(spec=requests.Response)
-        response.status_code = 200
-        response.json.return_value = {"data": {"id": 1, "name": "Test Tag"}}
-        response.headers = {}
-        mock_request.return_value = response
-
-        tag_data = {"name": "Test Tag"}
-        tag = client.tags.create_tag(tag_data)
-
-        assert isinstance(tag, dict)
-        assert tag.get("id") == 1
-        mock_request.assert_called_once()
-
-    @patch("open_to_close.base_client.requests.Session.request")
-    def test_retrieve_tag(
-        self, mock_request: Mock, client: OpenToCloseAPI, mock_response: Mock
-    ) -> None:
-        """Test retrieving a tag."""
-        mock_request.return_value = mock_response
-        mock_response.json.return_value = {"id": 123, "name": "VIP Client"}
-
-        tag = client.tags.retrieve_tag(123)
-
-        assert isinstance(tag, dict)
-        assert tag.get("id") == 123
-        mock_request.assert_called_once()
-
-    @patch("open_to_close.base_client.requests.Session.request")
-    def test_retrieve_tag_dict_response(
-        self, mock_request: Mock, client: OpenToCloseAPI
-    ) -> None:
-        """Test retrieving a tag with dict response containing data."""
-        response = Mock(spec=requests.Response)
-        response.status_code = 200
-        response.json.return_value = {"data": {"id": 123, "name": "Test Tag"}}
-        response.headers = {}
+        assert expected <= set(dir(getattr(client, attr)))
+
+    @pytest.mark.parametrize(
+        "response,expected",
+        [
+            (RESP_LIST, [{"id": 1, "name": "Test Item"}]),
+            (RESP_DATA_LIST, [{"id": 1, "name": "Test Item"}]),
+            (RESP_DATA_NOT_LIST, []),
+        ],
+        ids=["list", "data", "no_data"],
+    )
+    def test_list(
+        self,
+        mock_request: Mock,
+        client: OpenToCloseAPI,
+        attr: str,
+        noun: str,
+        parent_ids: Tuple[int, ...],
+        create_data: Dict[str, Any],
+        update_data: Dict[str, Any],
+        response: SimpleNamespace,
+        expected: List[Dict[str, Any]],
+    ) -> None:
+        """Test listing resources from bare lists and ``data`` envelopes."""
         mock_request.return_value = response
 
-        tag = client.tags.retrieve_tag(123)
+        items = _crud_method(client, attr, "list", noun)(*parent_ids)
 
-        assert isinstance(tag, dict)
-        assert tag.get("id") == 123
-        mock_request.assert_called_once()
+        assert items == expected
 
-    @patch("open_to_close.base_client.requests.Session.request")
-    def test_update_tag(
-        self, mock_request: Mock, client: OpenToCloseAPI, mock_response: Mock
+    def test_list_unexpected_response(
+        self,
+        mock_request: Mock,
+        client: OpenToCloseAPI,
+        attr: str,
+        noun: str,
+        parent_ids: Tuple[int, ...],
+        create_data: Dict[str, Any],
+        update_data: Dict[str, Any],
     ) -> None:
-        """Test updating a tag."""
-        mock_request.return_value = mock_response
-        mock_response.json.return_value = {
-            "id": 123,
-            "name": "Premium Client",
-            "color": "#00ff00",
-        }
-
-        update_data = {"name": "Premium Client", "color": "#00ff00"}
-        tag = client.tags.update_tag(123, update_data)
-
-        assert isinstance(tag, dict)
-        assert tag.get("id") == 123
-        assert tag.get("name") == "Premium Client"
-        mock_request.assert_called_once()
-
-    @patch("open_to_close.base_client.requests.Session.request")
-    def test_delete_tag(
-        self, mock_request: Mock, client: OpenToCloseAPI, mock_delete_response: Mock
-    ) -> None:
-        """Test deleting a tag."""
-        mock_request.return_value = mock_delete_response
-
-        result = client.tags.delete_tag(123)
-
-        assert isinstance(result, dict)
-        mock_request.assert_called_once()
-
-
-class TestTeamsAPI:
-    """Test TeamsAPI functionality."""
-
-    def test_teams_initialization(self, client: OpenToCloseAPI) -> None:
-        """Test that teams API can be initialized."""
-        teams = client.teams
-        assert teams is not None
-        assert hasattr(teams, "list_teams")
-        assert hasattr(teams, "create_team")
-        assert hasattr(teams, "retrieve_team")
-        assert hasattr(teams, "update_team")
-        assert hasattr(teams, "delete_team")
-
-    @patch("open_to_close.base_client.requests.Session.request")
-    def test_list_teams(
-        self, mock_request: Mock, client: OpenToCloseAPI, mock_list_response: Mock
-    ) -> None:
-        """Test listing teams."""
-        mock_request.return_value = mock_list_response
-
-        teams = client.teams.list_teams()
-
-        assert isinstance(teams, list)
-        assert len(teams) == 1
-        mock_request.assert_called_once()
-
-    @patch("open_to_close.base_client.requests.Session.request")
-    def test_list_teams_with_params(
-        self, mock_request: Mock, client: OpenToCloseAPI, mock_list_response: Mock
-    ) -> None:
-        """Test listing teams with parameters."""
-        mock_request.return_value = mock_list_response
-
-        teams = client.teams.list_teams(params={"limit": 50})
-
-        assert isinstance(teams, list)
-        mock_request.assert_called_once()
-
-    @patch("open_to_close.base_client.requests.Session.request")
-    def test_create_team(
-        self, mock_request: Mock, client: OpenToCloseAPI, mock_response: Mock
-    ) -> None:
-        """Test creating a team."""
-        mock_request.return_value = mock_response
-        mock_response.json.return_value = {
-            "id": 1,
-            "name": "Sales Team",
-            "description": "Primary sales team",
-        }
-
-        team_data = {"name": "Sales Team", "description": "Primary sales team"}
-        team = client.teams.create_team(team_data)
-
-        assert isinstance(team, dict)
-        assert team.get("id") == 1
-        assert team.get("name") == "Sales Team"
-        mock_request.assert_called_once()
-
-    @patch("open_to_close.base_client.requests.Session.request")
-    def test_retrieve_team(
-        self, mock_request: Mock, client: OpenToCloseAPI, mock_response: Mock
-    ) -> None:
-        """Test retrieving a team."""
-        mock_request.return_value = mock_response
-        mock_response.json.return_value = {"id": 123, "name": "Sales Team"}
-
-        team = client.teams.retrieve_team(123)
-
-        assert isinstance(team, dict)
-        assert team.get("id") == 123
-        mock_request.assert_called_once()
-
-    @patch("open_to_close.base_client.requests.Session.request")
-    def test_update_team(
-        self, mock_request: Mock, client: OpenToCloseAPI, mock_response: Mock
-    ) -> None:
-        """Test updating a team."""
-        mock_request.return_value = mock_response
-        mock_response.json.return_value = {
-            "id": 123,
-            "name": "Marketing Team",
-            "description": "Updated team",
-        }
-
-        update_data = {"name": "Marketing Team", "description": "Updated team"}
-        team = client.teams.update_team(123, update_data)
-
-        assert isinstance(team, dict)
-        assert team.get("id") == 123
-        assert team.get("name") == "Marketing Team"
-        mock_request.assert_called_once()
-
-    @patch("open_to_close.base_client.requests.Session.request")
-    def test_delete_team(
-        self, mock_request: Mock, client: OpenToCloseAPI, mock_delete_response: Mock
-    ) -> None:
-        """Test deleting a team."""
-        mock_request.return_value = mock_delete_response
-
-        result = client.teams.delete_team(123)
-
-        assert isinstance(result, dict)
-        mock_request.assert_called_once()
-
-
-class TestUsersAPI:
-    """Test UsersAPI functionality."""
-
-    def test_users_initialization(self, client: OpenToCloseAPI) -> None:
-        """Test that users API can be initialized."""
-        users = client.users
-        assert users is not None
-        assert hasattr(users, "list_users")
-        assert hasattr(users, "create_user")
-        assert hasattr(users, "retrieve_user")
-        assert hasattr(users, "update_user")
-        assert hasattr(users, "delete_user")
-
-    @patch("open_to_close.base_client.requests.Session.request")
-    def test_list_users(
-        self, mock_request: Mock, client: OpenToCloseAPI, mock_list_response: Mock
-    ) -> None:
-        """Test listing users."""
-        mock_request.return_value = mock_list_response
-
-        users = client.users.list_users()
-
-        assert isinstance(users, list)
-        assert len(users) == 1
-        mock_request.assert_called_once()
-
-    @patch("open_to_close.base_client.requests.Session.request")
-    def test_list_users_with_params(
-        self, mock_request: Mock, client: OpenToCloseAPI, mock_list_response: Mock
-    ) -> None:
-        """Test listing users with parameters."""
-        mock_request.return_value = mock_list_response
-
-        users = client.users.list_users(params={"limit": 25, "active": True})
-
-        assert isinstance(users, list)
-        mock_request.assert_called_once()
-
-    @patch("open_to_close.base_client.requests.Session.request")
-    def test_create_user(
-        self, mock_request: Mock, client: OpenToCloseAPI, mock_response: Mock
-    ) -> None:
-        """Test creating a user."""
-        mock_request.return_value = mock_response
-        mock_response.json.return_value = {
-            "id": 1,
-            "name": "John User",
-            "email": "john@example.com",
-            "role": "agent",
-        }
-
-        user_data = {
-            "name": "John User",
-            "email": "john@example.com",
-            "role": "agent",
-            "password": "secure_password",
-        }
-        user = client.users.create_user(user_data)
-
-        assert isinstance(user, dict)
-        assert user.get("id") == 1
-        assert user.get("email") == "john@example.com"
-        mock_request.assert_called_once()
-
-    @patch("open_to_close.base_client.requests.Session.request")
-    def test_retrieve_user(
-        self, mock_request: Mock, client: OpenToCloseAPI, mock_response: Mock
-    ) -> None:
-        """Test retrieving a user."""
-        mock_request.return_value = mock_response
-        mock_response.json.return_value = {
-            "id": 123,
-            "name": "John User",
-            "email": "john@example.com",
-        }
-
-        user = client.users.retrieve_user(123)
-
-        assert isinstance(user, dict)
-        assert user.get("id") == 123
-        assert user.get("email") == "john@example.com"
-        mock_request.assert_called_once()
-
-    @patch("open_to_close.base_client.requests.Session.request")
-    def test_update_user(
-        self, mock_request: Mock, client: OpenToCloseAPI, mock_response: Mock
-    ) -> None:
-        """Test updating a user."""
-        mock_request.return_value = mock_response
-        mock_response.json.return_value = {
-            "id": 123,
-            "name": "Jane User",
-            "role": "admin",
-        }
-
-        update_data = {"name": "Jane User", "role": "admin"}
-        user = client.users.update_user(123, update_data)
-
-        assert isinstance(user, dict)
-        assert user.get("id") == 123
-        assert user.get("name") == "Jane User"
-        mock_request.assert_called_once()
-
-    @patch("open_to_close.base_client.requests.Session.request")
-    def test_delete_user(
-        self, mock_request: Mock, client: OpenToCloseAPI, mock_delete_response: Mock
-    ) -> None:
-        """Test deleting a user."""
-        mock_request.return_value = mock_delete_response
-
-        result = client.users.delete_user(123)
-
-        assert isinstance(result, dict)
-        mock_request.assert_called_once()
-
-
-class TestPropertyEmailsAPI:
-    """Test PropertyEmailsAPI functionality."""
-
-    def test_property_emails_initialization(self, client: OpenToCloseAPI) -> None:
-        """Test that property emails API can be initialized."""
-        property_emails = client.property_emails
-        assert property_emails is not None
-        assert hasattr(property_emails, "list_property_emails")
-        assert hasattr(property_emails, "create_property_email")
-        assert hasattr(property_emails, "retrieve_property_email")
-        assert hasattr(property_emails, "update_property_email")
-        assert hasattr(property_emails, "delete_property_email")
-
-    @patch("open_to_close.base_client.requests.Session.request")
-    def test_list_property_emails(
-        self, mock_request: Mock, client: OpenToCloseAPI, mock_list_response: Mock
-    ) -> None:
-        """Test listing property emails."""
-        mock_request.return_value = mock_list_response
-
-        emails = client.property_emails.list_property_emails(1)
-
-        assert isinstance(emails, list)
-        mock_request.assert_called_once()
-
-    @patch("open_to_close.base_client.requests.Session.request")
-    def test_list_property_emails_with_params(
-        self, mock_request: Mock, client: OpenToCloseAPI, mock_list_response: Mock
-    ) -> None:
-        """Test listing property emails with parameters."""
-        mock_request.return_value = mock_list_response
-
-        emails = client.property_emails.list_property_emails(1, params={"limit": 10})
-
-        assert isinstance(emails, list)
-        mock_request.assert_called_once()
-
-    @patch("open_to_close.base_client.requests.Session.request")
-    def test_list_property_emails_dict_response(
-        self, mock_request: Mock, client: OpenToCloseAPI
-    ) -> None:
-        """Test listing property emails with dict response containing data."""
-        response = Mock(spec=requests.Response)
-        response.status_code = 200
-        response.json.return_value = {"data": [{"id": 1, "subject": "Test Email"}]}
-        response.headers = {}
-        mock_request.return_value = response
-
-        emails = client.property_emails.list_property_emails(1)
-
-        assert isinstance(emails, list)
-        assert len(emails) == 1
-        mock_request.assert_called_once()
-
-    @patch("open_to_close.base_client.requests.Session.request")
-    def test_list_property_emails_dict_response_no_data(
-        self, mock_request: Mock, client: OpenToCloseAPI
-    ) -> None:
-        """Test listing property emails with dict response but no data."""
-        response = Mock(spec=requests.Response)
-        response.status_code = 200
-        response.json.return_value = {"data": "not a list"}
-        response.headers = {}
-        mock_request.return_value = response
-
-        emails = client.property_emails.list_property_emails(1)
-
-        assert isinstance(emails, list)
-        assert len(emails) == 0
-        mock_request.assert_called_once()
-
-    @patch("open_to_close.base_client.requests.Session.request")
-    def test_list_property_emails_unexpected_response(
-        self, mock_request: Mock, client: OpenToCloseAPI
-    ) -> None:
-        """Test listing property emails with unexpected response format."""
-        response = Mock(spec=requests.Response)
-        response.status_code = 200
-        response.json.return_value = "unexpected string response"
-        response.headers = {}
-        mock_request.return_value = response
+        """Test listing resources with unexpected response format."""
+        mock_request.return_value = RESP_UNEXPECTED
 
         with pytest.raises(
             DataFormatError, match="Expected list or dict with list data"
         ):
-            client.property_emails.list_property_emails(1)
-
-    @patch("open_to_close.base_client.requests.Session.request")
-    def test_create_property_email(
-        self, mock_request: Mock, client: OpenToCloseAPI, mock_response: Mock
-    ) -> None:
-        """Test creating a property email."""
-        mock_request.return_value = mock_response
-        mock_response.json.return_value = {
-            "id": 1,
-            "subject": "Property Update",
-            "body": "Email content",
-            "property_id": 1,
-        }
-
-        email_data = {
-            "subject": "Property Update",
-            "body": "Email content",
-            "to": "client@example.com",
-        }
-        email = client.property_emails.create_property_email(1, email_data)
-
-        assert isinstance(email, dict)
-        assert email.get("id") == 1
-        assert email.get("subject") == "Property Update"
-        mock_request.assert_called_once()
-
-    @patch("open_to_close.base_client.requests.Session.request")
-    def test_create_property_email_dict_response(
-        self, mock_request: Mock, client: OpenToCloseAPI
-    ) -> None:
-        """Test creating a property email with dict response containing data."""
-        response = Mock(spec=requests.Response)
-        response.status_code = 200
-        response.json.return_value = {"data": {"id": 1, "subject": "Test Email"}}
-        response.headers = {}
+            _crud_method(client, attr, "list", noun)(*parent_ids)
+
+    @pytest.mark.parametrize(
+        "response,expected",
+        [(RESP_DATA_DICT, {"id": 1, "name": "Test Item"}), (RESP_DATA_NOT_DICT, {})],
+        ids=["data", "no_data"],
+    )
+    def test_create_dict_response(
+        self,
+        mock_request: Mock,
+        client: OpenToCloseAPI,
+        attr: str,
+        noun: str,
+        parent_ids: Tuple[int, ...],
+        create_data: Dict[str, Any],
+        update_data: Dict[str, Any],
+        response: SimpleNamespace,
+        expected: Dict[str, Any],
+    ) -> None:
+        """Test creating a resource with dict responses with and without data."""
         mock_request.return_value = response
 
-        email_data = {"subject": "Test Email"}
-        email = client.property_emails.create_property_email(1, email_data)
+        item = _crud_method(client, attr, "create", noun)(*parent_ids, create_data)
 
-        assert isinstance(email, dict)
-        assert email.get("id") == 1
-        mock_request.assert_called_once()
+        assert item == expected
 
-    @patch("open_to_close.base_client.requests.Session.request")
-    def test_create_property_email_dict_response_no_data(
-        self, mock_request: Mock, client: OpenToCloseAPI
+    def test_create_unexpected_response(
+        self,
+        mock_request: Mock,
+        client: OpenToCloseAPI,
+        attr: str,
+        noun: str,
+        parent_ids: Tuple[int, ...],
+        create_data: Dict[str, Any],
+        update_data: Dict[str, Any],
     ) -> None:
-        """Test creating a property email with dict response but no valid data."""
-        response = Mock(spec=requests.Response)
-        response.status_code = 200
-        response.json.return_value = {"data": "not a dict"}
-        response.headers = {}
-        mock_request.return_value = response
-
-        email_data = {"subject": "Test Email"}
-        email = client.property_emails.create_property_email(1, email_data)
-
-        assert isinstance(email, dict)
-        assert len(email) == 0
-        mock_request.assert_called_once()
+        """Test creating a resource with unexpected response format."""
+        mock_request.return_value = RESP_UNEXPECTED
 
-    @patch("open_to_close.base_client.requests.Session.request")
-    def test_create_property_email_unexpected_response(
-        self, mock_request: Mock, client: OpenToCloseAPI
-    ) -> None:
-        """Test creating a property email with unexpected response format."""
-        response = Mock(spec=requests.Response)
-        response.status_code = 200
-        response.json.return_value = "unexpected string response"
-        response.headers = {}
-        mock_request.return_value = response
-
-        email_data = {"subject": "Test Email"}
         with pytest.raises(DataFormatError, match="Expected dictionary response"):
-            client.property_emails.create_property_email(1, email_data)
-
-    @patch("open_to_close.base_client.requests.Session.request")
-    def test_retrieve_property_email(
-        self, mock_request: Mock, client: OpenToCloseAPI, mock_response: Mock
-    ) -> None:
-        """Test retrieving a property email."""
-        mock_request.return_value = mock_response
-        mock_response.json.return_value = {"id": 123, "subject": "Property Update"}
-
-        email = client.property_emails.retrieve_property_email(1, 123)
-
-        assert isinstance(email, dict)
-        assert email.get("id") == 123
-        mock_request.assert_called_once()
+            _crud_method(client, attr, "create", noun)(*parent_ids, create_data)
+
+    def test_list_with_params(
+        self,
+        mock_request: Mock,
+        client: OpenToCloseAPI,
+        attr: str,
+        noun: str,
+        parent_ids: Tuple[int, ...],
+        create_data: Dict[str, Any],
+        update_data: Dict[str, Any],
+    ) -> None:
+        """Test listing resources with parameters."""
+        mock_request.return_value = RESP_LIST
+
+        items = _crud_method(client, attr, "list", noun)(
+            *parent_ids, params={"limit": 10}
+        )
 
-    @patch("open_to_close.base_client.requests.Session.request")
-    def test_retrieve_property_email_dict_response(
-        self, mock_request: Mock, client: OpenToCloseAPI
-    ) -> None:
-        """Test retrieving a property email with dict response containing data."""
-        response = Mock(spec=requests.Response)
-        response.status_code = 200
-        response.json.return_value = {"data": {"id": 123, "subject": "Test Email"}}
-        response.headers = {}
+        assert isinstance(items, list)
+        assert mock_request.call_args[1]["params"]["limit"] == 10
+
+    def test_create(
+        self,
+        mock_request: Mock,
+        client: OpenToCloseAPI,
+        attr: str,
+        noun: str,
+        parent_ids: Tuple[int, ...],
+        create_data: Dict[str, Any],
+        update_data: Dict[str, Any],
+    ) -> None:
+        """Test creating a resource."""
+        mock_request.return_value = make_response({"id": 1, **create_data})
+
+        sent = dict(create_data)
+
+        item = _crud_method(client, attr, "create", noun)(*parent_ids, create_data)
+
+        assert item == {"id": 1, **create_data}
+        assert create_data == sent
+
+    def test_retrieve(
+        self,
+        mock_request: Mock,
+        client: OpenToCloseAPI,
+        attr: str,
+        noun: str,
+        parent_ids: Tuple[int, ...],
+        create_data: Dict[str, Any],
+        update_data: Dict[str, Any],
+    ) -> None:
+        """Test retrieving a resource."""
+        mock_request.return_value = make_response({"id": 123, **create_data})
+
+        item = _crud_method(client, attr, "retrieve", noun)(*parent_ids, 123)
+
+        assert item == {"id": 123, **create_data}
+        assert mock_request.call_args[1]["url"].endswith("/123")
+
+    def test_update(
+        self,
+        mock_request: Mock,
+        client: OpenToCloseAPI,
+        attr: str,
+        noun: str,
+        parent_ids: Tuple[int, ...],
+        create_data: Dict[str, Any],
+        update_data: Dict[str, Any],
+    ) -> None:
+        """Test updating a resource."""
+        mock_request.return_value = make_response({"id": 123, **update_data})
+
+        sent = dict(update_data)
+
+        item = _crud_method(client, attr, "update", noun)(*parent_ids, 123, update_data)
+
+        assert item == {"id": 123, **update_data}
+        assert update_data == sent
+        assert mock_request.call_args[1]["method"] == "PUT"
+
+    def test_retrieve_dict_response(
+        self,
+        mock_request: Mock,
+        client: OpenToCloseAPI,
+        attr: str,
+        noun: str,
+        parent_ids: Tuple[int, ...],
+        create_data: Dict[str, Any],
+        update_data: Dict[str, Any],
+    ) -> None:
+        """Test retrieving a resource with dict response containing data."""
+        response = make_response({"data": {"id": 123, **create_data}})
         mock_request.return_value = response
 
-        email = client.property_emails.retrieve_property_email(1, 123)
+        item = _crud_method(client, attr, "retrieve", noun)(*parent_ids, 123)
 
-        assert isinstance(email, dict)
-        assert email.get("id") == 123
-        mock_request.assert_called_once()
+        assert item == {"id": 123, **create_data}
 
-    @patch("open_to_close.base_client.requests.Session.request")
-    def test_update_property_email(
-        self, mock_request: Mock, client: OpenToCloseAPI, mock_response: Mock
+    def test_update_dict_response(
+        self,
+        mock_request: Mock,
+        client: OpenToCloseAPI,
+        attr: str,
+        noun: str,
+        parent_ids: Tuple[int, ...],
+        create_data: Dict[str, Any],
+        update_data: Dict[str, Any],
     ) -> None:
-        """Test updating a property email."""
-        mock_request.return_value = mock_response
-        mock_response.json.return_value = {"id": 123, "subject": "Updated Subject"}
-
-        update_data = {"subject": "Updated Subject"}
-        email = client.property_emails.update_property_email(1, 123, update_data)
-
-        assert isinstance(email, dict)
-        assert email.get("id") == 123
-        mock_request.assert_called_once()
-
-    @patch("open_to_close.base_client.requests.Session.request")
-    def test_update_property_email_dict_response(
-        self, mock_request: Mock, client: OpenToCloseAPI
-    ) -> None:
-        """Test updating a property email with dict response containing data."""
-        response = Mock(spec=requests.Response)
-        response.status_code = 200
-        response.json.return_value = {"data": {"id": 123, "subject": "Updated Email"}}
-        response.headers = {}
+        """Test updating a resource with dict response containing data."""
+        response = make_response({"data": {"id": 123, **update_data}})
         mock_request.return_value = response
 
-        update_data = {"subject": "Updated Email"}
-        email = client.property_emails.update_property_email(1, 123, update_data)
-
-        assert isinstance(email, dict)
-        assert email.get("id") == 123
-        mock_request.assert_called_once()
-
-    @patch("open_to_close.base_client.requests.Session.request")
-    def test_delete_property_email(
-        self, mock_request: Mock, client: OpenToCloseAPI, mock_delete_response: Mock
-    ) -> None:
-        """Test deleting a property email."""
-        mock_request.return_value = mock_delete_response
-
-        result = client.property_emails.delete_property_email(1, 123)
-
-        assert isinstance(result, dict)
-        mock_request.assert_called_once()
+        item = _crud_method(client, attr, "update", noun)(*parent_ids, 123, update_data)
 
+        assert item == {"id": 123, **update_data}
 
-class TestPropertyNotesAPI:
-    """Test PropertyNotesAPI functionality."""
-
-    def test_property_notes_initialization(self, client: OpenToCloseAPI) -> None:
-        """Test that property notes API can be initialized."""
-        property_notes = client.property_notes
-        assert property_notes is not None
-        assert hasattr(property_notes, "list_property_notes")
-        assert hasattr(property_notes, "create_property_note")
-        assert hasattr(property_notes, "retrieve_property_note")
-        assert hasattr(property_notes, "update_property_note")
-        assert hasattr(property_notes, "delete_property_note")
-
-    @patch("open_to_close.base_client.requests.Session.request")
-    def test_list_property_notes(
-        self, mock_request: Mock, client: OpenToCloseAPI, mock_list_response: Mock
+    def test_delete(
+        self,
+        mock_request: Mock,
+        client: OpenToCloseAPI,
+        attr: str,
+        noun: str,
+        parent_ids: Tuple[int, ...],
+        create_data: Dict[str, Any],
+        update_data: Dict[str, Any],
     ) -> None:
-        """Test listing property notes."""
-        mock_request.return_value = mock_list_response
+        """Test deleting a resource."""
+        mock_request.return_value = RESP_NO_CONTENT
 
-        notes = client.property_notes.list_property_notes(1)
+        result = _crud_method(client, attr, "delete", noun)(*parent_ids, 123)
 
-        assert isinstance(notes, list)
-        mock_request.assert_called_once()
+        assert result == {}
 
-    @patch("open_to_close.base_client.requests.Session.request")
-    def test_list_property_notes_dict_response(
-        self, mock_request: Mock, client: OpenToCloseAPI
-    ) -> None:
-        """Test listing property notes with dict response containing data."""
-        response = Mock(spec=requests.Response)
-        response.status_code = 200
-        response.json.return_value = {"data": [{"id": 1, "title": "Test Note"}]}
-        response.headers = {}
-        mock_request.return_value = response
 
-        notes = client.property_notes.list_property_notes(1)
-
-        assert isinstance(notes, list)
-        assert len(notes) == 1
-        mock_request.assert_called_once()
-
-    @patch("open_to_close.base_client.requests.Session.request")
-    def test_list_property_notes_dict_response_no_data(
-        self, mock_request: Mock, client: OpenToCloseAPI
-    ) -> None:
-        """Test listing property notes with dict response but no data."""
-        response = Mock(spec=requests.Response)
-        response.status_code = 200
-        response.json.return_value = {"data": "not a list"}
-        response.headers = {}
-        mock_request.return_value = response
-
-        notes = client.property_notes.list_property_notes(1)
-
-        assert isinstance(notes, list)
-        assert len(notes) == 0
-        mock_request.assert_called_once()
-
-    @patch("open_to_close.base_client.requests.Session.request")
-    def test_create_property_note(
-        self, mock_request: Mock, client: OpenToCloseAPI, mock_response: Mock
-    ) -> None:
-        """Test creating a property note."""
-        mock_request.return_value = mock_response
-        mock_response.json.return_value = {
-            "id": 1,
-            "title": "Important Note",
-            "content": "Note content",
-            "property_id": 1,
-        }
-
-        note_data = {"title": "Important Note", "content": "Note content"}
-        note = client.property_notes.create_property_note(1, note_data)
-
-        assert isinstance(note, dict)
-        assert note.get("id") == 1
-        assert note.get("title") == "Important Note"
-        mock_request.assert_called_once()
-
-    @patch("open_to_close.base_client.requests.Session.request")
-    def test_create_property_note_dict_response(
-        self, mock_request: Mock, client: OpenToCloseAPI
-    ) -> None:
-        """Test creating a property note with dict response containing data."""
-        response = Mock(spec=requests.Response)
-        response.status_code = 200
-        response.json.return_value = {"data": {"id": 1, "title": "Test Note"}}
-        response.headers = {}
-        mock_request.return_value = response
+class TestTagsAPI:
+    """Test TagsAPI functionality."""
 
-        note_data = {"title": "Test Note", "content": "This is test note content"}
-        note = client.property_notes.create_property_note(1, note_data)
+    @pytest.mark.expected_calls(3)
+    def test_delete_tags_bulk(self, mock_request: Mock, client: OpenToCloseAPI) -> None:
+        """Test bulk deleting tags collects results and errors per ID."""
+        not_found = make_response({"message": "Tag not found"}, status_code=404)
 
-        assert isinstance(note, dict)
-        assert note.get("id") == 1
-        mock_request.assert_called_once()
+        def respond(**kwargs: object) -> SimpleNamespace:
+            if str(kwargs["url"]).endswith("/tags/2"):
+                return not_found
+            return RESP_NO_CONTENT
 
-    @patch("open_to_close.base_client.requests.Session.request")
-    def test_create_property_note_dict_response_no_data(
-        self, mock_request: Mock, client: OpenToCloseAPI
-    ) -> None:
-        """Test creating a property note with dict response but no valid data."""
-        response = Mock(spec=requests.Response)
-        response.status_code = 200
-        response.json.return_value = {"data": "not a dict"}
-        response.headers = {}
-        mock_request.return_value = response
+        mock_request.side_effect = respond
 
-        note_data = {"title": "Test Note", "content": "This is test note content"}
-        note = client.property_notes.create_property_note(1, note_data)
+        results = client.tags.delete_tags_bulk([1, 2, 3, 1, "abc"])  # type: ignore[list-item]
 
-        assert isinstance(note, dict)
-        assert len(note) == 0
-        mock_request.assert_called_once()
+        assert list(results) == [1, 2, 3, "abc"]
+        assert results[1] == {}
+        assert results[3] == {}
+        assert isinstance(results[2], OpenToCloseAPIError)
+        assert isinstance(results["abc"], ValidationError)
 
-    @patch("open_to_close.base_client.requests.Session.request")
-    def test_retrieve_property_note(
-        self, mock_request: Mock, client: OpenToCloseAPI, mock_response: Mock
+    @pytest.mark.parametrize(
+        "tag_ids,max_workers", [("1,2", 4), ([1, 2], 0), ([1, 2], True)]
+    )
+    @pytest.mark.expected_calls(0)
+    def test_delete_tags_bulk_invalid_arguments(
+        self, client: OpenToCloseAPI, tag_ids: object, max_workers: object
     ) -> None:
-        """Test retrieving a property note."""
-        mock_request.return_value = mock_response
-        mock_response.json.return_value = {"id": 123, "title": "Important Note"}
+        """Test bulk deleting tags rejects invalid arguments up front."""
+        with pytest.raises(ValidationError):
+            client.tags.delete_tags_bulk(tag_ids, max_workers=max_workers)  # type: ignore[arg-type]
 
-        note = client.property_notes.retrieve_property_note(1, 123)
 
-        assert isinstance(note, dict)
-        assert note.get("id") == 123
-        mock_request.assert_called_once()
+class TestTeamsAPI:
+    """Test TeamsAPI functionality."""
 
-    @patch("open_to_close.base_client.requests.Session.request")
-    def test_retrieve_property_note_dict_response(
+    @pytest.mark.expected_calls(4)
+    def test_iter_teams_fetches_pages_concurrently(
         self, mock_request: Mock, client: OpenToCloseAPI
     ) -> None:
-        """Test retrieving a property note with dict response containing data."""
-        response = Mock(spec=requests.Response)
-        response.status_code = 200
-        response.json.return_value = {"data": {"id": 123, "title": "Test Note"}}
-        response.headers = {}
-        mock_request.return_value = response
-
-        note = client.property_notes.retrieve_property_note(1, 123)
+        """Test iterating teams yields every page in order."""
+        pages = {0: [{"id": 1}, {"id": 2}], 2: [{"id": 3}, {"id": 4}], 4: [{"id": 5}]}
 
-        assert isinstance(note, dict)
-        assert note.get("id") == 123
-        mock_request.assert_called_once()
+        def respond(**kwargs: Any) -> SimpleNamespace:
+            response = make_response(pages.get(kwargs["params"]["offset"], []))
+            return response
 
-    @patch("open_to_close.base_client.requests.Session.request")
-    def test_update_property_note(
-        self, mock_request: Mock, client: OpenToCloseAPI, mock_response: Mock
-    ) -> None:
-        """Test updating a property note."""
-        mock_request.return_value = mock_response
-        mock_response.json.return_value = {"id": 123, "title": "Updated Note"}
+        mock_request.side_effect = respond
 
-        update_data = {"title": "Updated Note"}
-        note = client.property_notes.update_property_note(1, 123, update_data)
+        teams = list(client.teams.iter_teams(page_size=2, concurrency=3))
 
-        assert isinstance(note, dict)
-        assert note.get("id") == 123
-        mock_request.assert_called_once()
+        assert [team["id"] for team in teams] == [1, 2, 3, 4, 5]
+        offsets = sorted(
+            call[1]["params"]["offset"] for call in mock_request.call_args_list
+        )
+        assert offsets == [0, 2, 4, 6]
 
-    @patch("open_to_close.base_client.requests.Session.request")
-    def test_update_property_note_dict_response(
+    @pytest.mark.expected_calls(3)
+    def test_iter_teams_fetches_pages_sequentially_by_default(
         self, mock_request: Mock, client: OpenToCloseAPI
     ) -> None:
-        """Test updating a property note with dict response containing data."""
-        response = Mock(spec=requests.Response)
-        response.status_code = 200
-        response.json.return_value = {"data": {"id": 123, "title": "Updated Note"}}
-        response.headers = {}
-        mock_request.return_value = response
-
-        update_data = {"title": "Updated Note"}
-        note = client.property_notes.update_property_note(1, 123, update_data)
-
-        assert isinstance(note, dict)
-        assert note.get("id") == 123
-        mock_request.assert_called_once()
-
-    @patch("open_to_close.base_client.requests.Session.request")
-    def test_delete_property_note(
-        self, mock_request: Mock, client: OpenToCloseAPI, mock_delete_response: Mock
-    ) -> None:
-        """Test deleting a property note."""
-        mock_request.return_value = mock_delete_response
-
-        result = client.property_notes.delete_property_note(1, 123)
-
-        assert isinstance(result, dict)
-        mock_request.assert_called_once()
-
-
-class TestPropertyDocumentsAPI:
-    """Test PropertyDocumentsAPI functionality."""
+        """Test that the default iteration stops at the first empty page."""
+        pages = {0: [{"id": 1}, {"id": 2}], 2: [{"id": 3}, {"id": 4}]}
 
-    def test_property_documents_initialization(self, client: OpenToCloseAPI) -> None:
-        """Test that property documents API can be initialized."""
-        property_documents = client.property_documents
-        assert property_documents is not None
-        assert hasattr(property_documents, "list_property_documents")
-        assert hasattr(property_documents, "create_property_document")
-        assert hasattr(property_documents, "retrieve_property_document")
-        assert hasattr(property_documents, "update_property_document")
-        assert hasattr(property_documents, "delete_property_document")
+        def respond(**kwargs: Any) -> SimpleNamespace:
+            return make_response(pages.get(kwargs["params"]["offset"], []))
 
-    @patch("open_to_close.base_client.requests.Session.request")
-    def test_list_property_documents(
-        self, mock_request: Mock, client: OpenToCloseAPI, mock_list_response: Mock
-    ) -> None:
-        """Test listing property documents."""
-        mock_request.return_value = mock_list_response
+        mock_request.side_effect = respond
 
-        documents = client.property_documents.list_property_documents(1)
+        teams = list(client.teams.iter_teams(page_size=2))
 
-        assert isinstance(documents, list)
-        mock_request.assert_called_once()
+        assert [team["id"] for team in teams] == [1, 2, 3, 4]
 
-    @patch("open_to_close.base_client.requests.Session.request")
-    def test_list_property_documents_dict_response(
+    def test_iter_teams_single_page_makes_one_request(
         self, mock_request: Mock, client: OpenToCloseAPI
     ) -> None:
-        """Test listing property documents with dict response containing data."""
-        response = Mock(spec=requests.Response)
-        response.status_code = 200
-        response.json.return_value = {"data": [{"id": 1, "title": "Test Document"}]}
-        response.headers = {}
-        mock_request.return_value = response
+        """Test that a short first page is not followed by prefetches."""
+        mock_request.return_value = RESP_LIST
 
-        documents = client.property_documents.list_property_documents(1)
+        teams = list(client.teams.iter_teams())
 
-        assert isinstance(documents, list)
-        assert len(documents) == 1
-        mock_request.assert_called_once()
+        assert teams == [{"id": 1, "name": "Test Item"}]
 
-    @patch("open_to_close.base_client.requests.Session.request")
-    def test_list_property_documents_dict_response_no_data(
+    @pytest.mark.expected_calls(2)
+    def test_retrieve_team_not_cached_by_default(
         self, mock_request: Mock, client: OpenToCloseAPI
     ) -> None:
-        """Test listing property documents with dict response but no data."""
-        response = Mock(spec=requests.Response)
-        response.status_code = 200
-        response.json.return_value = {"data": "not a list"}
-        response.headers = {}
-        mock_request.return_value = response
+        """Test that repeated retrieves hit the API when caching is off."""
+        mock_request.return_value = make_response({"id": 123, "name": "Sales Team"})
 
-        documents = client.property_documents.list_property_documents(1)
+        client.teams.retrieve_team(123)
+        client.teams.retrieve_team(123)
 
-        assert isinstance(documents, list)
-        assert len(documents) == 0
-        mock_request.assert_called_once()
+    @pytest.mark.expected_calls(3)
+    def test_retrieve_team_cached(self, mock_request: Mock) -> None:
+        """Test that cached teams are reused until the team is updated."""
+        client = OpenToCloseAPI(api_key="test_key", cache_ttl=60)
+        mock_request.return_value = make_response(
+            {"id": 123, "name": "Sales Team", "team_members": [{"id": 1}]}
+        )
 
-    @patch("open_to_close.base_client.requests.Session.request")
-    def test_create_property_document(
-        self, mock_request: Mock, client: OpenToCloseAPI, mock_response: Mock
-    ) -> None:
-        """Test creating a property document."""
-        mock_request.return_value = mock_response
-        mock_response.json.return_value = {
-            "id": 1,
-            "title": "Contract Document",
-            "filename": "contract.pdf",
-            "property_id": 1,
-        }
+        first = client.teams.retrieve_team(123)
+        first["name"] = "Changed locally"
+        first["team_members"][0]["id"] = 2
+        second = client.teams.retrieve_team(123)
+        second["team_members"].append({"id": 3})
 
-        document_data = {
-            "title": "Contract Document",
-            "name": "contract.pdf",
-            "filename": "contract.pdf",
-            "file_url": "http://example.com/contract.pdf",
+        assert client.teams.retrieve_team(123) == {
+            "id": 123,
+            "name": "Sales Team",
+            "team_members": [{"id": 1}],
         }
-        document = client.property_documents.create_property_document(1, document_data)
 
-        assert isinstance(document, dict)
-        assert document.get("id") == 1
-        assert document.get("title") == "Contract Document"
-        mock_request.assert_called_once()
+        client.teams.update_team(123, {"name": "Renamed Team"})
+        client.teams.retrieve_team(123)
 
-    @patch("open_to_close.base_client.requests.Session.request")
-    def test_create_property_document_dict_response(
-        self, mock_request: Mock, client: OpenToCloseAPI
-    ) -> None:
-        """Test creating a property document with dict response containing data."""
-        response = Mock(spec=requests.Response)
-        response.status_code = 200
-        response.json.return_value = {"data": {"id": 1, "title": "Test Document"}}
-        response.headers = {}
-        mock_request.return_value = response
-
-        document_data = {"title": "Test Document", "name": "test-document.pdf"}
-        document = client.property_documents.create_property_document(1, document_data)
 
-        assert isinstance(document, dict)
-        assert document.get("id") == 1
-        mock_request.assert_called_once()
+class TestUsersAPI:
+    """Test UsersAPI functionality."""
 
-    @patch("open_to_close.base_client.requests.Session.request")
-    def test_create_property_document_dict_response_no_data(
+    @pytest.mark.expected_calls(3)
+    def test_retrieve_users_bulk(
         self, mock_request: Mock, client: OpenToCloseAPI
     ) -> None:
-        """Test creating a property document with dict response but no valid data."""
-        response = Mock(spec=requests.Response)
-        response.status_code = 200
-        response.json.return_value = {"data": "not a dict"}
-        response.headers = {}
-        mock_request.return_value = response
+        """Test bulk retrieving users collects users and errors per ID."""
 
-        document_data = {"title": "Test Document", "name": "test-document.pdf"}
-        document = client.property_documents.create_property_document(1, document_data)
+        def respond(**kwargs: Any) -> SimpleNamespace:
+            user_id = int(str(kwargs["url"]).rsplit("/", 1)[1])
+            if user_id == 2:
+                return make_response({"message": "User not found"}, status_code=404)
+            return make_response({"id": user_id, "email": "a@b.com"})
 
-        assert isinstance(document, dict)
-        assert len(document) == 0
-        mock_request.assert_called_once()
+        mock_request.side_effect = respond
 
-    @patch("open_to_close.base_client.requests.Session.request")
-    def test_retrieve_property_document(
-        self, mock_request: Mock, client: OpenToCloseAPI, mock_response: Mock
-    ) -> None:
-        """Test retrieving a property document."""
-        mock_request.return_value = mock_response
-        mock_response.json.return_value = {"id": 123, "title": "Contract Document"}
-
-        document = client.property_documents.retrieve_property_document(1, 123)
+        users = client.users.retrieve_users_bulk([1, 2, 3])
 
-        assert isinstance(document, dict)
-        assert document.get("id") == 123
-        mock_request.assert_called_once()
+        assert users[1] == {"id": 1, "email": "a@b.com"}
+        assert users[3] == {"id": 3, "email": "a@b.com"}
+        assert isinstance(users[2], OpenToCloseAPIError)
 
-    @patch("open_to_close.base_client.requests.Session.request")
-    def test_retrieve_property_document_dict_response(
-        self, mock_request: Mock, client: OpenToCloseAPI
+    @pytest.mark.parametrize("concurrency", [0, -2, 1.5])
+    @pytest.mark.expected_calls(0)
+    def test_iter_users_invalid_concurrency(
+        self, client: OpenToCloseAPI, concurrency: object
     ) -> None:
-        """Test retrieving a property document with dict response containing data."""
-        response = Mock(spec=requests.Response)
-        response.status_code = 200
-        response.json.return_value = {"data": {"id": 123, "title": "Test Document"}}
-        response.headers = {}
-        mock_request.return_value = response
+        """Test that invalid concurrency is rejected before any request."""
+        with pytest.raises(ValidationError, match="concurrency"):
+            client.users.iter_users(concurrency=concurrency)  # type: ignore[arg-type]
 
-        document = client.property_documents.retrieve_property_document(1, 123)
-
-        assert isinstance(document, dict)
-        assert document.get("id") == 123
-        mock_request.assert_called_once()
-
-    @patch("open_to_close.base_client.requests.Session.request")
-    def test_update_property_document(
-        self, mock_request: Mock, client: OpenToCloseAPI, mock_response: Mock
+    @pytest.mark.expected_calls(3)
+    def test_retrieve_user_cache_invalidated_on_delete(
+        self, mock_request: Mock
     ) -> None:
-        """Test updating a property document."""
-        mock_request.return_value = mock_response
-        mock_response.json.return_value = {"id": 123, "title": "Updated Document"}
-
-        update_data = {"title": "Updated Document"}
-        document = client.property_documents.update_property_document(
-            1, 123, update_data
-        )
-
-        assert isinstance(document, dict)
-        assert document.get("id") == 123
-        mock_request.assert_called_once()
-
-    @patch("open_to_close.base_client.requests.Session.request")
-    def test_update_property_document_dict_response(
-        self, mock_request: Mock, client: OpenToCloseAPI
-    ) -> None:
-        """Test updating a property document with dict response containing data."""
-        response = Mock(spec=requests.Response)
-        response.status_code = 200
-        response.json.return_value = {"data": {"id": 123, "title": "Updated Document"}}
-        response.headers = {}
-        mock_request.return_value = response
-
-        update_data = {"title": "Updated Document"}
-        document = client.property_documents.update_property_document(
-            1, 123, update_data
+        """Test that deleting a user drops it from the cache."""
+        client = OpenToCloseAPI(api_key="test_key", cache_ttl=60)
+        mock_request.return_value = make_response(
+            {"id": 123, "email": "john@example.com"}
         )
 
-        assert isinstance(document, dict)
-        assert document.get("id") == 123
-        mock_request.assert_called_once()
-
-    @patch("open_to_close.base_client.requests.Session.request")
-    def test_delete_property_document(
-        self, mock_request: Mock, client: OpenToCloseAPI, mock_delete_response: Mock
-    ) -> None:
-        """Test deleting a property document."""
-        mock_request.return_value = mock_delete_response
-
-        result = client.property_documents.delete_property_document(1, 123)
-
-        assert isinstance(result, dict)
-        mock_request.assert_called_once()
+        client.users.retrieve_user(123)
+        client.users.retrieve_user(123)
+        assert mock_request.call_count == 1
 
+        client.users.delete_user(123)
+        client.users.retrieve_user(123)
 
-class TestPropertyTasksAPI:
-    """Test PropertyTasksAPI functionality."""
-
-    def test_property_tasks_initialization(self, client: OpenToCloseAPI) -> None:
-        """Test that property tasks API can be initialized."""
-        property_tasks = client.property_tasks
-        assert property_tasks is not None
-        assert hasattr(property_tasks, "list_property_tasks")
-        assert hasattr(property_tasks, "create_property_task")
-        assert hasattr(property_tasks, "retrieve_property_task")
-        assert hasattr(property_tasks, "update_property_task")
-        assert hasattr(property_tasks, "delete_property_task")
-
-    @patch("open_to_close.base_client.requests.Session.request")
-    def test_list_property_tasks(
-        self, mock_request: Mock, client: OpenToCloseAPI, mock_list_response: Mock
-    ) -> None:
-        """Test listing property tasks."""
-        mock_request.return_value = mock_list_response
 
-        tasks = client.property_tasks.list_property_tasks(1)
-
-        assert isinstance(tasks, list)
-        mock_request.assert_called_once()
-
-    @patch("open_to_close.base_client.requests.Session.request")
-    def test_list_property_tasks_dict_response(
-        self, mock_request: Mock, client: OpenToCloseAPI
-    ) -> None:
-        """Test listing property tasks with dict response containing data."""
-        response = Mock(spec=requests.Response)
-        response.status_code = 200
-        response.json.return_value = {"data": [{"id": 1, "title": "Test Task"}]}
-        response.headers = {}
-        mock_request.return_value = response
-
-        tasks = client.property_tasks.list_property_tasks(1)
-
-        assert isinstance(tasks, list)
-        assert len(tasks) == 1
-        mock_request.assert_called_once()
-
-    @patch("open_to_close.base_client.requests.Session.request")
-    def test_list_property_tasks_dict_response_no_data(
-        self, mock_request: Mock, client: OpenToCloseAPI
-    ) -> None:
-        """Test listing property tasks with dict response but no data."""
-        response = Mock(spec=requests.Response)
-        response.status_code = 200
-        response.json.return_value = {"data": "not a list"}
-        response.headers = {}
-        mock_request.return_value = response
-
-        tasks = client.property_tasks.list_property_tasks(1)
-
-        assert isinstance(tasks, list)
-        assert len(tasks) == 0
-        mock_request.assert_called_once()
-
-    @patch("open_to_close.base_client.requests.Session.request")
-    def test_create_property_task(
-        self, mock_request: Mock, client: OpenToCloseAPI, mock_response: Mock
-    ) -> None:
-        """Test creating a property task."""
-        mock_request.return_value = mock_response
-        mock_response.json.return_value = {
-            "id": 1,
-            "title": "Follow up with client",
-            "description": "Task description",
-            "property_id": 1,
-            "status": "pending",
-        }
-
-        task_data = {
-            "title": "Follow up with client",
-            "description": "Task description",
-            "due_date": "2024-01-15",
-        }
-        task = client.property_tasks.create_property_task(1, task_data)
-
-        assert isinstance(task, dict)
-        assert task.get("id") == 1
-        assert task.get("title") == "Follow up with client"
-        mock_request.assert_called_once()
+class TestPropertyNotesAPI:
+    """Test PropertyNotesAPI functionality."""
 
-    @patch("open_to_close.base_client.requests.Session.request")
-    def test_create_property_task_dict_response(
+    @pytest.mark.expected_calls(2)
+    def test_iter_property_notes_pages(
         self, mock_request: Mock, client: OpenToCloseAPI
     ) -> None:
-        """Test creating a property task with dict response containing data."""
-        response = Mock(spec=requests.Response)
-        response.status_code = 200
-        response.json.return_value = {"data": {"id": 1, "title": "Test Task"}}
-        response.headers = {}
-        mock_request.return_value = response
+        """Test iterating property notes requests pages until a short page."""
+        full_page = make_response({"data": [{"id": 1}, {"id": 2}]})
+        short_page = make_response({"data": [{"id": 3}]})
+        mock_request.side_effect = [full_page, short_page]
 
-        task_data = {"title": "Test Task"}
-        task = client.property_tasks.create_property_task(1, task_data)
+        notes = client.property_notes.iter_property_notes(
+            1, params={"author": "agent"}, page_size=2
+        )
 
-        assert isinstance(task, dict)
-        assert task.get("id") == 1
-        mock_request.assert_called_once()
+        assert [note["id"] for note in notes] == [1, 2, 3]
+        first_params = mock_request.call_args_list[0][1]["params"]
+        second_params = mock_request.call_args_list[1][1]["params"]
+        assert first_params["author"] == "agent"
+        assert (first_params["limit"], first_params["offset"]) == (2, 0)
+        assert (second_params["limit"], second_params["offset"]) == (2, 2)
 
-    @patch("open_to_close.base_client.requests.Session.request")
-    def test_create_property_task_dict_response_no_data(
+    def test_iter_property_notes_stops_early(
         self, mock_request: Mock, client: OpenToCloseAPI
     ) -> None:
-        """Test creating a property task with dict response but no valid data."""
-        response = Mock(spec=requests.Response)
-        response.status_code = 200
-        response.json.return_value = {"data": "not a dict"}
-        response.headers = {}
+        """Test that breaking out of the iterator skips remaining pages."""
+        response = make_response([{"id": 1}, {"id": 2}])
         mock_request.return_value = response
 
-        task_data = {"title": "Test Task"}
-        task = client.property_tasks.create_property_task(1, task_data)
+        for note in client.property_notes.iter_property_notes(1, page_size=2):
+            break
 
-        assert isinstance(task, dict)
-        assert len(task) == 0
-        mock_request.assert_called_once()
+        assert note == {"id": 1}
 
-    @patch("open_to_close.base_client.requests.Session.request")
-    def test_retrieve_property_task(
-        self, mock_request: Mock, client: OpenToCloseAPI, mock_response: Mock
+    @pytest.mark.parametrize("page_size", [0, -1, "abc"])
+    @pytest.mark.expected_calls(0)
+    def test_iter_property_notes_invalid_page_size(
+        self, client: OpenToCloseAPI, page_size: object
     ) -> None:
-        """Test retrieving a property task."""
-        mock_request.return_value = mock_response
-        mock_response.json.return_value = {"id": 123, "title": "Follow up with client"}
+        """Test that an invalid page size is rejected before any request."""
+        with pytest.raises(ValidationError):
+            client.property_notes.iter_property_notes(1, page_size=page_size)  # type: ignore[arg-type]
 
-        task = client.property_tasks.retrieve_property_task(1, 123)
-
-        assert isinstance(task, dict)
-        assert task.get("id") == 123
-        mock_request.assert_called_once()
-
-    @patch("open_to_close.base_client.requests.Session.request")
-    def test_retrieve_property_task_dict_response(
+    @pytest.mark.expected_calls(2)
+    def test_delete_property_notes_bulk(
         self, mock_request: Mock, client: OpenToCloseAPI
     ) -> None:
-        """Test retrieving a property task with dict response containing data."""
-        response = Mock(spec=requests.Response)
-        response.status_code = 200
-        response.json.return_value = {"data": {"id": 123, "title": "Test Task"}}
-        response.headers = {}
-        mock_request.return_value = response
-
-        task = client.property_tasks.retrieve_property_task(1, 123)
+        """Test bulk removing notes from a property."""
+        mock_request.return_value = RESP_NO_CONTENT
 
-        assert isinstance(task, dict)
-        assert task.get("id") == 123
-        mock_request.assert_called_once()
+        results = client.property_notes.delete_property_notes_bulk(1, [10, 11])
 
-    @patch("open_to_close.base_client.requests.Session.request")
-    def test_update_property_task(
-        self, mock_request: Mock, client: OpenToCloseAPI, mock_response: Mock
-    ) -> None:
-        """Test updating a property task."""
-        mock_request.return_value = mock_response
-        mock_response.json.return_value = {
-            "id": 123,
-            "title": "Updated Task",
-            "status": "completed",
-        }
+        assert results == {10: {}, 11: {}}
+        urls = sorted(call[1]["url"] for call in mock_request.call_args_list)
+        assert urls == [
+            "https://api.opentoclose.com/v1/properties/1/notes/10",
+            "https://api.opentoclose.com/v1/properties/1/notes/11",
+        ]
 
-        update_data = {"title": "Updated Task", "status": "completed"}
-        task = client.property_tasks.update_property_task(1, 123, update_data)
 
-        assert isinstance(task, dict)
-        assert task.get("id") == 123
-        assert task.get("status") == "completed"
-        mock_request.assert_called_once()
+class TestPropertyTasksAPI:
+    """Test PropertyTasksAPI functionality."""
 
-    @patch("open_to_close.base_client.requests.Session.request")
-    def test_update_property_task_dict_response(
+    @pytest.mark.expected_calls(2)
+    def test_iter_property_tasks_repeated_page(
         self, mock_request: Mock, client: OpenToCloseAPI
     ) -> None:
-        """Test updating a property task with dict response containing data."""
-        response = Mock(spec=requests.Response)
-        response.status_code = 200
-        response.json.return_value = {"data": {"id": 123, "title": "Updated Task"}}
-        response.headers = {}
+        """Test iteration stops when the endpoint ignores offset."""
+        response = make_response([{"id": 1}, {"id": 2}])
         mock_request.return_value = response
 
-        update_data = {"title": "Updated Task"}
-        task = client.property_tasks.update_property_task(1, 123, update_data)
-
-        assert isinstance(task, dict)
-        assert task.get("id") == 123
-        mock_request.assert_called_once()
-
-    @patch("open_to_close.base_client.requests.Session.request")
-    def test_delete_property_task(
-        self, mock_request: Mock, client: OpenToCloseAPI, mock_delete_response: Mock
-    ) -> None:
-        """Test deleting a property task."""
-        mock_request.return_value = mock_delete_response
-
-        result = client.property_tasks.delete_property_task(1, 123)
+        tasks = list(client.property_tasks.iter_property_tasks(1, page_size=2))
 
-        assert isinstance(result, dict)
-        mock_request.assert_called_once()
+        assert tasks == [{"id": 1}, {"id": 2}]
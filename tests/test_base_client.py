@@ -1,13 +1,30 @@
 """Tests for BaseClient functionality."""
 
+import copy
+import datetime
+import importlib
+import json
+from collections import OrderedDict
+from typing import Any, Dict, Type
 from unittest.mock import Mock, patch
 
 import pytest
 import requests
 
-from open_to_close.base_client import BaseClient
+from open_to_close import _json
+from open_to_close.base_client import (
+    ACCEPT_ENCODING,
+    CONNECT_RETRIES,
+    JSON_HEADERS,
+    BaseClient,
+    _ClientAdapter,
+    _encode_json_body,
+    _JSONResponse,
+)
 from open_to_close.exceptions import (
     AuthenticationError,
+    ConfigurationError,
+    DataFormatError,
     NetworkError,
     NotFoundError,
     OpenToCloseAPIError,
@@ -16,6 +33,81 @@ from open_to_close.exceptions import (
     ValidationError,
 )
 
+from .helpers import make_response
+
+# Response stubs shared by tests that only read them
+RESP_ID = make_response({"id": 1})
+RESP_DATA = make_response({"data": "test"})
+
+# (status code, method, decoded body) for successful responses
+HANDLE_RESPONSE_SUCCESS_CASES = (
+    (200, "GET", {"id": 1, "name": "test"}),
+    (201, "POST", {"id": 1, "name": "created"}),
+)
+
+# (status code, method, error message, exception, expected match) per error status
+HANDLE_RESPONSE_ERROR_CASES = (
+    (
+        400,
+        "POST",
+        "Invalid request",
+        ValidationError,
+        "Bad request to POST /test: Invalid request",
+    ),
+    (
+        401,
+        "GET",
+        "Invalid credentials",
+        AuthenticationError,
+        "Authentication failed for GET /test: Invalid credentials",
+    ),
+    (
+        404,
+        "GET",
+        "Resource not found",
+        NotFoundError,
+        "Resource not found for GET /test: Resource not found",
+    ),
+    (
+        429,
+        "GET",
+        "Too many requests",
+        RateLimitError,
+        "Rate limit exceeded for GET /test: Too many requests",
+    ),
+    (
+        500,
+        "GET",
+        "Internal server error",
+        ServerError,
+        "Server error for GET /test: Internal server error",
+    ),
+    (
+        418,
+        "GET",
+        "Unknown error",
+        OpenToCloseAPIError,
+        "Unexpected error for GET /test: Unknown error",
+    ),
+)
+
+
+@pytest.fixture(scope="module")
+def shared_client() -> BaseClient:
+    """Create one BaseClient for the whole module."""
+    return BaseClient(api_key="test_key")
+
+
+@pytest.fixture
+def client(shared_client: BaseClient) -> BaseClient:
+    """Return a shallow copy of the shared client.
+
+    Attribute changes stay local to the test, while the session and its
+    adapter are shared; tests patch ``Session.request``, so no traffic reaches
+    the adapter.
+    """
+    return copy.copy(shared_client)
+
 
 class TestBaseClient:
     """Test BaseClient functionality."""
@@ -52,180 +144,209 @@ class TestBaseClient:
         client = BaseClient(api_key="test_key")
         expected_headers = {
             "Accept": "application/json",
+            "Accept-Encoding": ACCEPT_ENCODING,
             "Content-Type": "application/json",
         }
         for key, value in expected_headers.items():
             assert client.session.headers.get(key) == value
 
-    @patch("open_to_close.base_client.requests.Session.request")
-    def test_handle_response_200(self, mock_request: Mock) -> None:
-        """Test handling successful 200 response."""
+    def test_session_mounts_client_adapter(self) -> None:
+        """Test that the session routes requests through the client adapter."""
         client = BaseClient(api_key="test_key")
-        response = Mock(spec=requests.Response)
-        response.status_code = 200
-        response.content = b'{"id": 1, "name": "test"}'
-        response.json.return_value = {"id": 1, "name": "test"}
-        response.headers = {}
+        adapter = client.session.get_adapter("https://api.opentoclose.com/v1")
+        assert isinstance(adapter, _ClientAdapter)
+
+    def test_pool_maxsize_configures_adapter(self) -> None:
+        """Test that pool_maxsize sizes the keep-alive pool for concurrent use."""
+        client = BaseClient(api_key="test_key", pool_maxsize=32)
+        adapter = client.session.get_adapter("https://api.opentoclose.com")
+        assert client.pool_maxsize == 32
+        assert adapter._pool_maxsize == 32
+
+    @pytest.mark.parametrize("pool_maxsize", [0, -1, 2.5, "8"])
+    def test_invalid_pool_maxsize_raises_error(self, pool_maxsize: Any) -> None:
+        """Test that invalid pool sizes raise ConfigurationError."""
+        with pytest.raises(ConfigurationError, match="Invalid pool_maxsize"):
+            BaseClient(api_key="test_key", pool_maxsize=pool_maxsize)
+
+    def test_invalid_etag_cache_ttl_raises_error(self) -> None:
+        """Test that a non-positive ETag cache TTL raises ConfigurationError."""
+        with pytest.raises(ConfigurationError, match="Invalid etag_cache_ttl"):
+            BaseClient(api_key="test_key", etag_cache_ttl=0)
+
+    def test_adapter_retries_only_connection_failures(self) -> None:
+        """Test that the adapter retries connects but leaves statuses to _request."""
+        client = BaseClient(api_key="test_key")
+        retry = client.session.get_adapter("https://api.opentoclose.com").max_retries
+        assert retry.connect == CONNECT_RETRIES
+        assert retry.read == 0
+        assert retry.status == 0
+        assert not retry.is_retry("GET", 429, has_retry_after=True)
+        assert not retry.is_retry("POST", 503)
+
+    def test_init_with_shared_session(self) -> None:
+        """Test that an existing session is reused as-is."""
+        session = requests.Session()
+        client = BaseClient(api_key="test_key", session=session)
+        other = BaseClient(api_key="test_key", session=client.session)
+
+        assert client.session is session
+        assert other.session is session
+
+    def test_init_with_invalid_session_raises_error(self) -> None:
+        """Test that a non-Session object is rejected."""
+        with pytest.raises(ConfigurationError, match="Invalid session"):
+            BaseClient(api_key="test_key", session="session")  # type: ignore[arg-type]
+
+    def test_json_response_decodes_body(self) -> None:
+        """Test that the fast JSON response decodes raw body bytes."""
+        response = _JSONResponse()
+        response._content = b'{"id": 1, "name": "test"}'
+        assert response.json() == {"id": 1, "name": "test"}
+
+    def test_json_response_invalid_body_raises_value_error(self) -> None:
+        """Test that undecodable bodies still raise ValueError."""
+        response = _JSONResponse()
+        response._content = b"invalid json"
+        with pytest.raises(ValueError):
+            response.json()
+
+    @pytest.mark.parametrize("backend", ["orjson", "ujson"])
+    def test_encode_json_body(
+        self, monkeypatch: pytest.MonkeyPatch, reload_json: None, backend: str
+    ) -> None:
+        """Test that request bodies round-trip through each fast backend."""
+        pytest.importorskip(backend)
+        monkeypatch.setenv("OPEN_TO_CLOSE_JSON_BACKEND", backend)
+        importlib.reload(_json)
+        payload = {"name": "Test", "tags": ["a", "b"], "count": 2, "ok": True}
+
+        body = _encode_json_body(payload)
+
+        assert body is not None
+        assert json.loads(body) == payload
+
+    def test_encode_json_body_falls_back(self) -> None:
+        """Test that unencodable payloads are left for requests to serialize."""
+        assert _encode_json_body({"value": object()}) is None
+        with patch("open_to_close._json.BACKEND", "json"):
+            assert _encode_json_body({"name": "Test"}) is None
+
+    @pytest.mark.parametrize(
+        "value",
+        [float("nan"), float("inf"), datetime.date(2024, 1, 1)],
+        ids=["nan", "inf", "date"],
+    )
+    def test_encode_json_body_leaves_invalid_values_to_requests(
+        self, value: Any
+    ) -> None:
+        """Test that values requests rejects are never encoded by the backend."""
+        assert _encode_json_body({"purchase_amount": value}) is None
 
-        result = client._handle_response(response, "/test", "GET")
-        assert result == {"id": 1, "name": "test"}
+    def test_post_with_files_sends_json_unencoded(
+        self, mock_session_request: Mock, client: BaseClient
+    ) -> None:
+        """Test that JSON payloads sent alongside files are not pre-encoded."""
+        response = make_response({"id": 1}, status_code=201)
+        mock_session_request.return_value = response
 
-    @patch("open_to_close.base_client.requests.Session.request")
-    def test_handle_response_201(self, mock_request: Mock) -> None:
-        """Test handling successful 201 response."""
-        client = BaseClient(api_key="test_key")
-        response = Mock(spec=requests.Response)
-        response.status_code = 201
-        response.content = b'{"id": 1, "name": "created"}'
-        response.json.return_value = {"id": 1, "name": "created"}
-        response.headers = {}
+        json_data = {"name": "Test"}
+        files = {"file": ("test.txt", b"content", "text/plain")}
+        client.post("/upload", json_data=json_data, files=files)
+
+        call_kwargs = mock_session_request.call_args[1]
+        assert call_kwargs["json"] == json_data
+        assert call_kwargs["data"] is None
+
+    @pytest.mark.parametrize(
+        "status_code,method,payload",
+        HANDLE_RESPONSE_SUCCESS_CASES,
+        ids=[str(case[0]) for case in HANDLE_RESPONSE_SUCCESS_CASES],
+    )
+    def test_handle_response_success(
+        self,
+        client: BaseClient,
+        status_code: int,
+        method: str,
+        payload: Dict[str, Any],
+    ) -> None:
+        """Test that successful responses return the decoded body."""
+        response = make_response(payload, status_code=status_code)
+
+        assert client._handle_response(response, "/test", method) == payload
+
+    @pytest.mark.parametrize(
+        "status_code,method,message,error,match",
+        HANDLE_RESPONSE_ERROR_CASES,
+        ids=[str(case[0]) for case in HANDLE_RESPONSE_ERROR_CASES],
+    )
+    def test_handle_response_error(
+        self,
+        client: BaseClient,
+        status_code: int,
+        method: str,
+        message: str,
+        error: Type[OpenToCloseAPIError],
+        match: str,
+    ) -> None:
+        """Test that error statuses raise the matching exception."""
+        response = make_response({"message": message}, status_code=status_code)
 
-        result = client._handle_response(response, "/test", "POST")
-        assert result == {"id": 1, "name": "created"}
+        with pytest.raises(error, match=match):
+            client._handle_response(response, "/test", method)
 
-    @patch("open_to_close.base_client.requests.Session.request")
-    def test_handle_response_204(self, mock_request: Mock) -> None:
+    def test_handle_response_204(self, client: BaseClient) -> None:
         """Test handling 204 No Content response."""
-        client = BaseClient(api_key="test_key")
-        response = Mock(spec=requests.Response)
+        response = Mock()
         response.status_code = 204
         response.content = b""
-
         response.headers = {}
+
         result = client._handle_response(response, "/test", "DELETE")
         assert result == {}
 
-    @patch("open_to_close.base_client.requests.Session.request")
-    def test_handle_response_400_validation_error(self, mock_request: Mock) -> None:
-        """Test handling 400 Bad Request response."""
-        client = BaseClient(api_key="test_key")
-        response = Mock(spec=requests.Response)
-        response.status_code = 400
-        response.content = b'{"message": "Invalid request"}'
-        response.json.return_value = {"message": "Invalid request"}
-
-        response.headers = {}
-        with pytest.raises(
-            ValidationError, match="Bad request to POST /test: Invalid request"
-        ):
-            client._handle_response(response, "/test", "POST")
-
-    @patch("open_to_close.base_client.requests.Session.request")
-    def test_handle_response_401_authentication_error(self, mock_request: Mock) -> None:
-        """Test handling 401 Unauthorized response."""
-        client = BaseClient(api_key="test_key")
-        response = Mock(spec=requests.Response)
-        response.status_code = 401
-        response.content = b'{"message": "Invalid credentials"}'
-        response.json.return_value = {"message": "Invalid credentials"}
-
-        response.headers = {}
-        with pytest.raises(
-            AuthenticationError,
-            match="Authentication failed for GET /test: Invalid credentials",
-        ):
-            client._handle_response(response, "/test", "GET")
-
-    @patch("open_to_close.base_client.requests.Session.request")
-    def test_handle_response_404_not_found_error(self, mock_request: Mock) -> None:
-        """Test handling 404 Not Found response."""
-        client = BaseClient(api_key="test_key")
-        response = Mock(spec=requests.Response)
-        response.status_code = 404
-        response.content = b'{"message": "Resource not found"}'
-        response.json.return_value = {"message": "Resource not found"}
-
-        response.headers = {}
-        with pytest.raises(
-            NotFoundError, match="Resource not found for GET /test: Resource not found"
-        ):
-            client._handle_response(response, "/test", "GET")
-
-    @patch("open_to_close.base_client.requests.Session.request")
-    def test_handle_response_429_rate_limit_error(self, mock_request: Mock) -> None:
-        """Test handling 429 Rate Limit response."""
-        client = BaseClient(api_key="test_key")
-        response = Mock(spec=requests.Response)
-        response.status_code = 429
-        response.content = b'{"message": "Too many requests"}'
-        response.json.return_value = {"message": "Too many requests"}
-        response.headers = {}
-
-        with pytest.raises(
-            RateLimitError, match="Rate limit exceeded for GET /test: Too many requests"
-        ):
-            client._handle_response(response, "/test", "GET")
-
-    @patch("open_to_close.base_client.requests.Session.request")
-    def test_handle_response_500_server_error(self, mock_request: Mock) -> None:
-        """Test handling 500 Server Error response."""
-        client = BaseClient(api_key="test_key")
-        response = Mock(spec=requests.Response)
-        response.status_code = 500
-        response.content = b'{"message": "Internal server error"}'
-        response.json.return_value = {"message": "Internal server error"}
-
+    def test_handle_response_204_skips_parsing(self, client: BaseClient) -> None:
+        """Test that 204 responses are closed without reading the body."""
+        response = Mock()
+        response.status_code = 204
         response.headers = {}
-        with pytest.raises(
-            ServerError, match="Server error for GET /test: Internal server error"
-        ):
-            client._handle_response(response, "/test", "GET")
 
-    @patch("open_to_close.base_client.requests.Session.request")
-    def test_handle_response_unknown_error(self, mock_request: Mock) -> None:
-        """Test handling unknown error response."""
-        client = BaseClient(api_key="test_key")
-        response = Mock(spec=requests.Response)
-        response.status_code = 418  # I'm a teapot
-        response.content = b'{"message": "Unknown error"}'
-        response.json.return_value = {"message": "Unknown error"}
+        result = client._handle_response(response, "/test", "DELETE")
 
-        response.headers = {}
-        with pytest.raises(
-            OpenToCloseAPIError, match="Unexpected error for GET /test: Unknown error"
-        ):
-            client._handle_response(response, "/test", "GET")
+        assert result == {}
+        response.json.assert_not_called()
+        response.close.assert_called_once()
 
-    @patch("open_to_close.base_client.requests.Session.request")
-    def test_handle_response_invalid_json(self, mock_request: Mock) -> None:
+    def test_handle_response_invalid_json(self, client: BaseClient) -> None:
         """Test handling response with invalid JSON."""
-        client = BaseClient(api_key="test_key")
-        response = Mock(spec=requests.Response)
+        response = Mock()
         response.status_code = 400
         response.content = b"invalid json"
         response.text = "invalid json"
         response.json.side_effect = ValueError("Invalid JSON")
-
         response.headers = {}
+
         with pytest.raises(
             ValidationError, match="Bad request to POST /test: invalid json"
         ):
             client._handle_response(response, "/test", "POST")
 
-    @patch("open_to_close.base_client.requests.Session.request")
-    def test_handle_response_no_content(self, mock_request: Mock) -> None:
+    def test_handle_response_no_content(self, client: BaseClient) -> None:
         """Test handling response with no content."""
-        client = BaseClient(api_key="test_key")
-        response = Mock(spec=requests.Response)
+        response = Mock()
         response.status_code = 200
         response.content = b""
-
         response.headers = {}
+
         result = client._handle_response(response, "/test", "GET")
         assert result == {}
 
-    @patch("open_to_close.base_client.requests.Session.request")
-    def test_request_method(self, mock_session_request: Mock) -> None:
+    def test_request_method(
+        self, mock_session_request: Mock, client: BaseClient
+    ) -> None:
         """Test the _request method."""
-        client = BaseClient(api_key="test_key")
-
         # Mock response
-        response = Mock(spec=requests.Response)
-        response.status_code = 200
-        response.content = b'{"id": 1}'
-        response.json.return_value = {"id": 1}
-        response.headers = {}
-        mock_session_request.return_value = response
+        mock_session_request.return_value = RESP_ID
 
         result = client._request("GET", "/test", params={"limit": 10})
 
@@ -236,15 +357,16 @@ class TestBaseClient:
             json=None,
             data=None,
             files=None,
+            headers=None,
             params={"limit": 10, "api_token": "test_key"},
             timeout=30.0,
         )
         assert result == {"id": 1}
 
-    @patch("open_to_close.base_client.requests.Session.request")
-    def test_request_network_error(self, mock_session_request: Mock) -> None:
+    def test_request_network_error(
+        self, mock_session_request: Mock, client: BaseClient
+    ) -> None:
         """Test _request method with network error."""
-        client = BaseClient(api_key="test_key")
         mock_session_request.side_effect = requests.exceptions.ConnectionError(
             "Connection failed"
         )
@@ -254,17 +376,9 @@ class TestBaseClient:
         ):
             client._request("GET", "/test")
 
-    @patch("open_to_close.base_client.requests.Session.request")
-    def test_get_method(self, mock_session_request: Mock) -> None:
+    def test_get_method(self, mock_session_request: Mock, client: BaseClient) -> None:
         """Test the get method."""
-        client = BaseClient(api_key="test_key")
-
-        response = Mock(spec=requests.Response)
-        response.status_code = 200
-        response.content = b'{"data": "test"}'
-        response.json.return_value = {"data": "test"}
-        response.headers = {}
-        mock_session_request.return_value = response
+        mock_session_request.return_value = RESP_DATA
 
         result = client.get("/test", params={"page": 1})
 
@@ -274,69 +388,92 @@ class TestBaseClient:
             json=None,
             data=None,
             files=None,
+            headers=None,
             params={"page": 1, "api_token": "test_key"},
             timeout=30.0,
         )
         assert result == {"data": "test"}
 
-    @patch("open_to_close.base_client.requests.Session.request")
-    def test_post_method(self, mock_session_request: Mock) -> None:
-        """Test the post method."""
-        client = BaseClient(api_key="test_key")
+    def test_request_does_not_mutate_params(
+        self, mock_session_request: Mock, client: BaseClient
+    ) -> None:
+        """Test that the api_token is not written into the caller's params."""
+        mock_session_request.return_value = RESP_DATA
 
-        response = Mock(spec=requests.Response)
-        response.status_code = 201
-        response.content = b'{"id": 1, "created": true}'
-        response.json.return_value = {"id": 1, "created": True}
-        response.headers = {}
+        params = {"page": 1}
+        client.get("/test", params=params)
+
+        assert params == {"page": 1}
+        assert mock_session_request.call_args[1]["params"] == {
+            "page": 1,
+            "api_token": "test_key",
+        }
+
+    @pytest.mark.parametrize("level,logged", [("INFO", True), ("WARNING", False)])
+    def test_request_logging_respects_level(
+        self,
+        mock_session_request: Mock,
+        caplog: pytest.LogCaptureFixture,
+        level: str,
+        logged: bool,
+        client: BaseClient,
+    ) -> None:
+        """Test that request details are only logged when INFO is enabled."""
+        mock_session_request.return_value = RESP_ID
+
+        with caplog.at_level(level, logger="open_to_close.base_client"):
+            client.get("/test", params={"page": 1})
+
+        messages = [record.getMessage() for record in caplog.records]
+        assert ("Making GET request to /test" in messages) is logged
+
+    def test_post_method(self, mock_session_request: Mock, client: BaseClient) -> None:
+        """Test the post method."""
+        response = make_response({"id": 1, "created": True}, status_code=201)
         mock_session_request.return_value = response
 
         json_data = {"name": "Test", "value": 123}
         result = client.post("/test", json_data=json_data)
 
+        body = _encode_json_body(json_data)
         mock_session_request.assert_called_once_with(
             method="POST",
             url="https://api.opentoclose.com/v1/test",
-            json=json_data,
-            data=None,
+            json=json_data if body is None else None,
+            data=body,
             files=None,
+            headers=None if body is None else JSON_HEADERS,
             params={"api_token": "test_key"},
             timeout=30.0,
         )
         assert result == {"id": 1, "created": True}
 
-    @patch("open_to_close.base_client.requests.Session.request")
-    def test_put_method(self, mock_session_request: Mock) -> None:
+    def test_put_method(self, mock_session_request: Mock, client: BaseClient) -> None:
         """Test the put method."""
-        client = BaseClient(api_key="test_key")
-
-        response = Mock(spec=requests.Response)
-        response.status_code = 200
-        response.content = b'{"id": 1, "updated": true}'
-        response.json.return_value = {"id": 1, "updated": True}
-        response.headers = {}
+        response = make_response({"id": 1, "updated": True})
         mock_session_request.return_value = response
 
         json_data = {"name": "Updated Test"}
         result = client.put("/test/1", json_data=json_data)
 
+        body = _encode_json_body(json_data)
         mock_session_request.assert_called_once_with(
             method="PUT",
             url="https://api.opentoclose.com/v1/test/1",
-            json=json_data,
-            data=None,
+            json=json_data if body is None else None,
+            data=body,
             files=None,
+            headers=None if body is None else JSON_HEADERS,
             params={"api_token": "test_key"},
             timeout=30.0,
         )
         assert result == {"id": 1, "updated": True}
 
-    @patch("open_to_close.base_client.requests.Session.request")
-    def test_delete_method(self, mock_session_request: Mock) -> None:
+    def test_delete_method(
+        self, mock_session_request: Mock, client: BaseClient
+    ) -> None:
         """Test the delete method."""
-        client = BaseClient(api_key="test_key")
-
-        response = Mock(spec=requests.Response)
+        response = Mock()
         response.status_code = 204
         response.content = b""
         response.headers = {}
@@ -350,50 +487,39 @@ class TestBaseClient:
             json=None,
             data=None,
             files=None,
+            headers=None,
             params={"api_token": "test_key"},
             timeout=30.0,
         )
         assert result == {}
+        response.close.assert_called_once()
 
-    @patch("open_to_close.base_client.requests.Session.request")
-    def test_patch_method(self, mock_session_request: Mock) -> None:
+    def test_patch_method(self, mock_session_request: Mock, client: BaseClient) -> None:
         """Test the patch method."""
-        client = BaseClient(api_key="test_key")
-
-        response = Mock(spec=requests.Response)
-        response.status_code = 200
-        response.content = b'{"id": 1, "patched": true}'
-        response.json.return_value = {"id": 1, "patched": True}
-        response.headers = {}
+        response = make_response({"id": 1, "patched": True})
         mock_session_request.return_value = response
 
         json_data = {"status": "active"}
         result = client.patch("/test/1", json_data=json_data)
 
+        body = _encode_json_body(json_data)
         mock_session_request.assert_called_once_with(
             method="PATCH",
             url="https://api.opentoclose.com/v1/test/1",
-            json=json_data,
-            data=None,
+            json=json_data if body is None else None,
+            data=body,
             files=None,
+            headers=None if body is None else JSON_HEADERS,
             params={"api_token": "test_key"},
             timeout=30.0,
         )
         assert result == {"id": 1, "patched": True}
 
-    @patch("open_to_close.base_client.requests.Session.request")
     def test_request_with_leading_slash_endpoint(
-        self, mock_session_request: Mock
+        self, mock_session_request: Mock, client: BaseClient
     ) -> None:
         """Test _request method with endpoint that has leading slash."""
-        client = BaseClient(api_key="test_key")
-
-        response = Mock(spec=requests.Response)
-        response.status_code = 200
-        response.content = b'{"data": "test"}'
-        response.json.return_value = {"data": "test"}
-        response.headers = {}
-        mock_session_request.return_value = response
+        mock_session_request.return_value = RESP_DATA
 
         result = client._request("GET", "/test")
 
@@ -404,21 +530,17 @@ class TestBaseClient:
             json=None,
             data=None,
             files=None,
+            headers=None,
             params={"api_token": "test_key"},
             timeout=30.0,
         )
         assert result == {"data": "test"}
 
-    @patch("open_to_close.base_client.requests.Session.request")
-    def test_request_with_files(self, mock_session_request: Mock) -> None:
+    def test_request_with_files(
+        self, mock_session_request: Mock, client: BaseClient
+    ) -> None:
         """Test _request method with files parameter."""
-        client = BaseClient(api_key="test_key")
-
-        response = Mock(spec=requests.Response)
-        response.status_code = 200
-        response.content = b'{"uploaded": true}'
-        response.json.return_value = {"uploaded": True}
-        response.headers = {}
+        response = make_response({"uploaded": True})
         mock_session_request.return_value = response
 
         files = {"file": ("test.txt", "file content")}
@@ -430,21 +552,17 @@ class TestBaseClient:
             json=None,
             data=None,
             files=files,
+            headers=None,
             params={"api_token": "test_key"},
             timeout=30.0,
         )
         assert result == {"uploaded": True}
 
-    @patch("open_to_close.base_client.requests.Session.request")
-    def test_request_with_data(self, mock_session_request: Mock) -> None:
+    def test_request_with_data(
+        self, mock_session_request: Mock, client: BaseClient
+    ) -> None:
         """Test _request method with data parameter."""
-        client = BaseClient(api_key="test_key")
-
-        response = Mock(spec=requests.Response)
-        response.status_code = 200
-        response.content = b'{"submitted": true}'
-        response.json.return_value = {"submitted": True}
-        response.headers = {}
+        response = make_response({"submitted": True})
         mock_session_request.return_value = response
 
         data = {"form_field": "value"}
@@ -456,7 +574,54 @@ class TestBaseClient:
             json=None,
             data=data,
             files=None,
+            headers=None,
             params={"api_token": "test_key"},
             timeout=30.0,
         )
         assert result == {"submitted": True}
+
+    def test_process_list_response_shapes(self, client: BaseClient) -> None:
+        """Test list unwrapping for bare and wrapped list responses."""
+        items = [{"id": 1}]
+        assert client._process_list_response(items, "/test") is items
+        assert client._process_list_response({"data": items}, "/test") is items
+        assert client._process_list_response({"data": "bad"}, "/test") == []
+        assert client._process_list_response({"id": 1}, "/test") == [{"id": 1}]
+
+    def test_process_list_response_invalid_format(self, client: BaseClient) -> None:
+        """Test that non-list, non-dict list responses raise DataFormatError."""
+        with pytest.raises(DataFormatError):
+            client._process_list_response("unexpected", "/test")  # type: ignore
+
+    def test_process_response_data_shapes(self, client: BaseClient) -> None:
+        """Test item unwrapping for direct, wrapped and dict-subclass responses."""
+        item = {"id": 1}
+        assert client._process_response_data(item, "/test") is item
+        assert client._process_response_data({"data": item}, "/test") is item
+        assert client._process_response_data({"data": []}, "/test") == {}
+        assert (
+            client._process_response_data({"id": None, "data": item}, "/test") is item
+        )
+        assert client._process_response_data({"name": "x"}, "/test") == {"name": "x"}
+        assert client._process_response_data(OrderedDict(id=2), "/test") == {"id": 2}
+        with pytest.raises(DataFormatError):
+            client._process_response_data([item], "/test")  # type: ignore
+
+    def test_validate_pagination_params(self, client: BaseClient) -> None:
+        """Test shared limit/offset normalization for list parameters."""
+        params = {"limit": "50", "offset": "10", "status": "open"}
+        validated = client._validate_pagination_params(params)
+        assert validated == {"limit": 50, "offset": 10, "status": "open"}
+        assert validated is not params
+        assert client._validate_pagination_params(None) == {}
+
+    @pytest.mark.parametrize(
+        "params",
+        [{"limit": 0}, {"limit": "many"}, {"offset": -1}, {"offset": None}, []],
+    )
+    def test_validate_pagination_params_invalid(
+        self, params: Any, client: BaseClient
+    ) -> None:
+        """Test that invalid pagination values raise ValidationError."""
+        with pytest.raises(ValidationError):
+            client._validate_pagination_params(params)
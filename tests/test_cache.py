@@ -0,0 +1,90 @@
+"""Tests for the in-memory response cache."""
+
+from unittest.mock import patch
+
+import pytest
+
+from open_to_close import OpenToCloseAPI
+from open_to_close._cache import TTLCache
+from open_to_close.base_client import BaseClient
+from open_to_close.exceptions import ConfigurationError
+
+
+class TestTTLCache:
+    """Test TTLCache functionality."""
+
+    def test_set_and_get(self) -> None:
+        """Test that stored values are returned until removed."""
+        cache = TTLCache(ttl=60)
+        cache.set(1, {"id": 1})
+
+        assert cache.get(1) == {"id": 1}
+        assert cache.get(2) is None
+
+        cache.pop(1)
+        assert cache.get(1) is None
+
+    @patch("open_to_close._cache.time.monotonic")
+    def test_entries_expire(self, mock_monotonic: object) -> None:
+        """Test that entries are dropped once their TTL has passed."""
+        mock_monotonic.return_value = 100.0  # type: ignore[attr-defined]
+        cache = TTLCache(ttl=10)
+        cache.set("key", "value")
+
+        mock_monotonic.return_value = 109.0  # type: ignore[attr-defined]
+        assert cache.get("key") == "value"
+
+        mock_monotonic.return_value = 110.0  # type: ignore[attr-defined]
+        assert cache.get("key") is None
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used(self) -> None:
+        """Test that the least recently used entry is evicted when full."""
+        cache = TTLCache(ttl=60, maxsize=2)
+        cache.set(1, "one")
+        cache.set(2, "two")
+        cache.get(1)
+        cache.set(3, "three")
+
+        assert cache.get(1) == "one"
+        assert cache.get(2) is None
+        assert cache.get(3) == "three"
+
+    def test_clear(self) -> None:
+        """Test that clear removes every entry."""
+        cache = TTLCache(ttl=60)
+        cache.set(1, "one")
+        cache.set(2, "two")
+        cache.clear()
+
+        assert len(cache) == 0
+
+
+class TestResponseCacheConfiguration:
+    """Test response cache configuration on BaseClient."""
+
+    def test_cache_disabled_by_default(self) -> None:
+        """Test that no cache is created without a TTL."""
+        client = BaseClient(api_key="test_key")
+        assert client._create_response_cache(None) is None
+
+    def test_cache_created_with_ttl(self) -> None:
+        """Test that a positive TTL creates a cache."""
+        client = BaseClient(api_key="test_key")
+        cache = client._create_response_cache(30)
+
+        assert isinstance(cache, TTLCache)
+        assert cache.ttl == 30.0
+
+    @pytest.mark.parametrize("cache_ttl", [0, -5, "60", True])
+    def test_invalid_cache_ttl_raises_error(self, cache_ttl: object) -> None:
+        """Test that invalid TTL values are rejected."""
+        client = BaseClient(api_key="test_key")
+        with pytest.raises(ConfigurationError, match="Invalid cache_ttl"):
+            client._create_response_cache(cache_ttl)  # type: ignore[arg-type]
+
+    @pytest.mark.parametrize("option", ["cache_ttl", "etag_cache_ttl"])
+    def test_invalid_ttl_rejected_by_main_client(self, option: str) -> None:
+        """Test that OpenToCloseAPI rejects a bad TTL before any client is built."""
+        with pytest.raises(ConfigurationError, match=f"Invalid {option}"):
+            OpenToCloseAPI(api_key="test_key", **{option: -1})
@@ -0,0 +1,45 @@
+"""Tests for JSON backend selection."""
+
+import importlib
+
+import pytest
+
+from open_to_close import _json
+
+
+class TestJSONBackend:
+    """Test JSON backend selection and round-tripping."""
+
+    @pytest.mark.parametrize("backend", ["orjson", "ujson", "json"])
+    def test_preferred_backend_round_trip(
+        self, monkeypatch: pytest.MonkeyPatch, reload_json: None, backend: str
+    ) -> None:
+        """Test that each available backend encodes and decodes payloads."""
+        if backend != "json":
+            pytest.importorskip(backend)
+        monkeypatch.setenv("OPEN_TO_CLOSE_JSON_BACKEND", backend)
+        importlib.reload(_json)
+
+        payload = {"name": "Café/Test", "tags": ["a", "b"], "count": 2, "ok": None}
+
+        assert _json.BACKEND == backend
+        assert isinstance(_json.dumps(payload), bytes)
+        assert _json.loads(_json.dumps(payload)) == payload
+
+    def test_unknown_backend_falls_back(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        reload_json: None,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        """Test that an unknown backend name is ignored with a warning."""
+        monkeypatch.setenv("OPEN_TO_CLOSE_JSON_BACKEND", "simplejson")
+        importlib.reload(_json)
+
+        assert _json.BACKEND in _json.BACKENDS
+        assert "Unknown OPEN_TO_CLOSE_JSON_BACKEND" in caplog.text
+
+    def test_invalid_json_raises_value_error(self) -> None:
+        """Test that every backend reports bad input as ValueError."""
+        with pytest.raises(ValueError):
+            _json.loads(b"invalid json")
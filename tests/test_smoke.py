@@ -1,4 +1,8 @@
 # Basic smoke tests
+import typing
+
+import pytest
+
 import open_to_close
 
 
@@ -10,3 +14,30 @@ def test_package_imports() -> None:
 def test_basic_client_instantiation() -> None:
     client = open_to_close.OpenToCloseAPI("test_key")
     assert client is not None
+
+
+def test_lazy_service_client_exports() -> None:
+    from open_to_close.tags import TagsAPI
+
+    assert open_to_close.TagsAPI is TagsAPI
+    assert "TagsAPI" in dir(open_to_close)
+
+
+def test_unknown_attribute_raises() -> None:
+    with pytest.raises(AttributeError):
+        open_to_close.NotAClient
+
+
+SERVICE_CLIENTS = [
+    name
+    for name in open_to_close.__all__
+    if name.endswith("API") and name != "OpenToCloseAPI"
+]
+
+
+@pytest.mark.parametrize("name", SERVICE_CLIENTS)
+def test_service_client_type_hints_resolve(name: str) -> None:
+    client_class = getattr(open_to_close, name)
+    for attr in vars(client_class).values():
+        if callable(attr):
+            typing.get_type_hints(attr)